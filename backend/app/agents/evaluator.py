@@ -1,11 +1,42 @@
 """
 Evaluator Agent - Evaluates answers using NLP features and fuzzy logic.
 """
-from datetime import datetime
-from app.models.schemas import AnswerEvaluation, Question, InterviewState
-from app.services.nlp_service import nlp_service
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from app.config import settings
+from app.models.schemas import AnswerEvaluation, EvaluationScore, InterviewState, NLPFeatures, Question
+from app.services.nlp_service import MAX_TEXT_CHARS, nlp_executor, nlp_service
 from app.services.fuzzy_service import fuzzy_service
 
+# Scoring is deterministic on the analyzed answer text: bounded LRU of (features, scores) keyed by BLAKE2s digest
+_scoring_cache: OrderedDict[bytes, tuple[NLPFeatures, EvaluationScore]] = OrderedDict()
+_scoring_cache_lock = threading.Lock()
+
+
+def _scoring_key(answer: str) -> bytes:
+    """Build the scoring cache key for an answer (only the part NLPService analyzes is hashed)."""
+    return hashlib.blake2s(answer[:MAX_TEXT_CHARS].encode("utf-8"), digest_size=16).digest()
+
+
+def _scoring_cache_get(key: bytes) -> tuple[NLPFeatures, EvaluationScore] | None:
+    """Look up a cached scoring result, marking it as recently used."""
+    with _scoring_cache_lock:
+        result = _scoring_cache.get(key)
+        if result is not None:
+            _scoring_cache.move_to_end(key)
+        return result
+
+
+def _scoring_cache_put(key: bytes, result: tuple[NLPFeatures, EvaluationScore]) -> None:
+    """Store a scoring result, evicting the least recently used entries."""
+    with _scoring_cache_lock:
+        _scoring_cache[key] = result
+        _scoring_cache.move_to_end(key)
+        while len(_scoring_cache) > settings.scoring_cache_size:
+            _scoring_cache.popitem(last=False)
+
 
 class EvaluatorAgent:
     """Agent responsible for evaluating interview answers."""
@@ -30,37 +61,97 @@ class EvaluatorAgent:
         Returns:
             AnswerEvaluation with scores and extracted features
         """
-        # Step 1: Extract NLP features from the answer
-        features = self.nlp_service.extract_features(answer)
+        features, scores = self.extract_and_evaluate(answer)
+
+        return self._build_evaluation(question, answer, features, scores)
+
+    def extract_and_evaluate(self, answer: str) -> tuple[NLPFeatures, EvaluationScore]:
+        """
+        Extract NLP features and fuzzy scores for an answer, reusing cached results for repeated text.
 
-        # Step 2: Apply fuzzy logic to calculate scores
-        scores = self.fuzzy_service.evaluate(features, answer)
+        Args:
+            answer: The candidate's answer
+
+        Returns:
+            (features, scores) for the answer
+        """
+        key = _scoring_key(answer)
+        result = _scoring_cache_get(key)
+        if result is None:
+            # Step 1: Extract NLP features from the answer
+            features = self.nlp_service.extract_features(answer)
 
-        # Step 3: Get feature summary for interpretability
+            # Step 2: Apply fuzzy logic to calculate scores
+            scores = self.fuzzy_service.evaluate(features, answer)
+
+            result = (features, scores)
+            _scoring_cache_put(key, result)
+        return result
+
+    def _build_evaluation(
+        self,
+        question: Question,
+        answer: str,
+        features: NLPFeatures,
+        scores: EvaluationScore
+    ) -> AnswerEvaluation:
+        """Package scores and features into an AnswerEvaluation."""
+        # Get feature summary for interpretability
         feature_summary = self.nlp_service.get_feature_summary(features)
 
-        # Convert NLP features to dict for storage
-        nlp_features_dict = {
-            "word_count": features.word_count,
-            "sentence_count": features.sentence_count,
-            "avg_sentence_length": features.avg_sentence_length,
-            "sentiment_score": features.sentiment_score,
-            "confidence_indicators": features.confidence_indicators,
-            "filler_words_count": features.filler_words_count,
-            "technical_terms_count": features.technical_terms_count,
-            "coherence_score": features.coherence_score,
-            "complexity_score": features.complexity_score,
-            "summary": feature_summary
-        }
+        # Convert NLP features to dict for storage (the schema's serializers round the floats)
+        nlp_features_dict = features.model_dump()
+        nlp_features_dict["summary"] = feature_summary
 
         return AnswerEvaluation(
             question_id=question.question_id,
             answer_text=answer,
             scores=scores,
-            nlp_features=nlp_features_dict,
-            timestamp=datetime.utcnow()
+            nlp_features=nlp_features_dict
         )
 
+    def evaluate_batch(self, pairs: list[tuple[Question, str]]) -> list[AnswerEvaluation]:
+        """
+        Evaluate several question-answer pairs in a single call.
+
+        Args:
+            pairs: (question, answer) pairs to evaluate
+
+        Returns:
+            List of evaluations in the same order as the pairs
+        """
+        keys = [_scoring_key(answer) for _, answer in pairs]
+        results = [_scoring_cache_get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        if misses:
+            features_list = self.nlp_service.extract_features_batch([pairs[i][1] for i in misses])
+
+            # Score all uncached answers with one vectorized fuzzy pass
+            scores_list = self.fuzzy_service.evaluate_batch(features_list)
+
+            for i, features, scores in zip(misses, features_list, scores_list):
+                results[i] = (features, scores)
+                _scoring_cache_put(keys[i], results[i])
+
+        return [
+            self._build_evaluation(question, answer, features, scores)
+            for (question, answer), (features, scores) in zip(pairs, results)
+        ]
+
+    async def aevaluate_batch(self, pairs: list[tuple[Question, str]]) -> list[AnswerEvaluation]:
+        """
+        Evaluate several question-answer pairs without blocking the event loop.
+
+        Args:
+            pairs: (question, answer) pairs to evaluate
+
+        Returns:
+            List of evaluations in the same order as the pairs
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(nlp_executor, self.evaluate_batch, pairs)
+
     def get_evaluation_insights(self, evaluation: AnswerEvaluation) -> dict:
         """
         Generate insights from an evaluation.
@@ -117,19 +208,11 @@ class EvaluatorAgent:
         Returns:
             List of evaluations for all question-answer pairs
         """
-        evaluations = []
-        
-        # Evaluate all question-answer pairs
-        for i, (question, answer) in enumerate(zip(state.questions, state.answers)):
-            # Skip if already evaluated
-            if i < len(state.evaluations):
-                continue
-            
-            # Evaluate this answer
-            evaluation = self.evaluate_answer(question, answer)
-            evaluations.append(evaluation)
-        
-        return evaluations
+        # Evaluate all question-answer pairs not yet evaluated in one batch
+        evaluated = len(state.evaluations)
+        pending = list(zip(state.questions[evaluated:], state.answers[evaluated:]))
+
+        return self.evaluate_batch(pending)
 
     def _interpret_score(self, score: float) -> str:
         """Interpret a numeric score into a performance level."""
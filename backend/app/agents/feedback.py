@@ -62,7 +62,7 @@ class FeedbackAgent:
         # Build context for LLM
         prompt = self._build_feedback_prompt(state, overall_score)
 
-        # Get LLM feedback
+        # Get LLM feedback (never semantically cached: it is personal to this candidate's transcript)
         response = self.llm.invoke(prompt)
         llm_feedback = response.content.strip()
 
@@ -71,6 +71,37 @@ class FeedbackAgent:
 
         return feedback
 
+    async def stream_feedback(self, state: InterviewState):
+        """
+        Stream the raw feedback text for the entire interview.
+
+        Args:
+            state: Complete interview state with all Q&A and evaluations
+
+        Yields:
+            Text chunks as they are generated
+        """
+        overall_score = self._calculate_overall_score(state.evaluations)
+        prompt = self._build_feedback_prompt(state, overall_score)
+
+        async for chunk in self.llm.astream(prompt):
+            if hasattr(chunk, 'content') and chunk.content:
+                yield chunk.content
+
+    def parse_feedback(self, llm_feedback: str, state: InterviewState) -> InterviewFeedback:
+        """
+        Build structured feedback from the full (e.g. streamed) LLM feedback text.
+
+        Args:
+            llm_feedback: Complete LLM feedback text
+            state: Interview state the feedback was generated for
+
+        Returns:
+            InterviewFeedback with detailed analysis and recommendations
+        """
+        overall_score = self._calculate_overall_score(state.evaluations)
+        return self._parse_llm_feedback(llm_feedback.strip(), overall_score, state)
+
     def _calculate_overall_score(self, evaluations: list[AnswerEvaluation]) -> float:
         """Calculate average overall score across all evaluations."""
         if not evaluations:
@@ -1,10 +1,10 @@
 """
 Interviewer Agent - Generates contextual interview questions using LLM.
 """
-from datetime import datetime
 from app.config import settings
 from app.models.schemas import Question, InterviewState
 
+from app.llm.semantic_cache import invoke_llm
 from app.mocks.agents import MockInterviewerAgent
 from app.prompts.interview import get_all_questions_prompt, get_followup_question_prompt, get_initial_question_prompt
 
@@ -58,13 +58,12 @@ class InterviewerAgent:
             The first interview question
         """
         prompt = self._build_initial_prompt(state)
-        response = self.llm.invoke(prompt)
+        question_text = invoke_llm(self.llm, prompt)
 
         return Question(
             question_id=1,
-            question_text=response.content.strip(),
-            category="opening",
-            timestamp=datetime.utcnow()
+            question_text=question_text,
+            category="opening"
         )
 
     async def stream_first_question(self, state: InterviewState):
@@ -95,16 +94,18 @@ class InterviewerAgent:
         """
         question_id = len(state.questions) + 1
         prompt = self._build_followup_prompt(state, question_id)
+        # Not semantically cached: consecutive turns of one session embed almost identically
+        # once the history outgrows the embedding window, so a hit would repeat a question
         response = self.llm.invoke(prompt)
+        question_text = response.content.strip()
 
         # Determine category based on question number
         category = self._determine_category(question_id, state.total_questions)
 
         return Question(
             question_id=question_id,
-            question_text=response.content.strip(),
-            category=category,
-            timestamp=datetime.utcnow()
+            question_text=question_text,
+            category=category
         )
 
     async def stream_next_question(self, state: InterviewState):
@@ -135,10 +136,10 @@ class InterviewerAgent:
             List of all interview questions
         """
         prompt = self._build_all_questions_prompt(state)
-        response = self.llm.invoke(prompt)
+        response_text = invoke_llm(self.llm, prompt)
         
         # Parse the response to extract all questions
-        questions = self._parse_all_questions(response.content.strip(), state.total_questions)
+        questions = self._parse_all_questions(response_text, state.total_questions)
         
         return questions
 
@@ -226,8 +227,7 @@ class InterviewerAgent:
                 questions.append(Question(
                     question_id=question_id,
                     question_text=question_text,
-                    category=category,
-                    timestamp=datetime.utcnow()
+                    category=category
                 ))
         
         # Ensure we have exactly total_questions
@@ -239,8 +239,7 @@ class InterviewerAgent:
                 questions.append(Question(
                     question_id=question_id,
                     question_text=f"Pregunta {question_id} (generada como respaldo)",
-                    category=category,
-                    timestamp=datetime.utcnow()
+                    category=category
                 ))
         elif len(questions) > total_questions:
             # If we got more, take only the first total_questions
@@ -1,26 +1,27 @@
 """
 FastAPI routes for interview operations.
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Query
+from fastapi.responses import Response
 from app.models.schemas import (
     StartInterviewRequest,
     SubmitAnswerRequest,
     InterviewSessionResponse,
     AnswerResponse,
-    FeedbackResponse,
-    Question
+    FeedbackResponse
 )
 from app.graph.workflow import interview_workflow
 from app.agents.interviewer import interviewer_agent
 from app.config import settings
 from app.store import interview_sessions
-from app.services.audio_service import synthesize_audio_base64
+from app.services.audio_service import synthesize_audio_base64, synthesize_audio_base64_batch, tts_mime_type
 
 router = APIRouter(prefix="/api/interviews", tags=["interviews"])
 
 @router.post("/start", response_model=InterviewSessionResponse, status_code=status.HTTP_201_CREATED)
 async def start_interview(
     request: StartInterviewRequest,
+    background_tasks: BackgroundTasks,
     include_audio: bool = Query(False, description="Include synthesized audio for the question")
 ):
     """
@@ -43,7 +44,7 @@ async def start_interview(
         )
 
         # Store session
-        interview_sessions[state.session_id] = state
+        await interview_sessions.aset(state.session_id, state)
 
         # Get the first question that was generated
         first_question = state.questions[0]
@@ -52,14 +53,16 @@ async def start_interview(
         audio_data = None
         if include_audio:
             audio_data = await synthesize_audio_base64(first_question.question_text)
+            # Warm the TTS cache for pre-generated questions so later answers return audio immediately
+            if len(state.questions) > 1:
+                background_tasks.add_task(
+                    synthesize_audio_base64_batch,
+                    [question.question_text for question in state.questions[1:]]
+                )
         
-        # Create question with audio data if available
-        question_with_audio = Question(
-            question_id=first_question.question_id,
-            question_text=first_question.question_text,
-            category=first_question.category,
-            timestamp=first_question.timestamp,
-            audio_data=audio_data
+        # Copy question with audio data if available (no re-validation of the stored question)
+        question_with_audio = first_question.model_copy(
+            update={"audio_data": audio_data, "audio_mime_type": tts_mime_type() if audio_data else None}
         )
 
         return InterviewSessionResponse(
@@ -96,88 +99,90 @@ async def submit_answer(
         request: Answer submission
         include_audio: If True, synthesize and include audio data for the next question
     """
-    # Get session
-    state = interview_sessions.get(session_id)
-    if not state:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Interview session {session_id} not found"
-        )
+    # Serialize submissions for the session: the read-modify-write below spans awaits
+    async with interview_sessions.lock(session_id):
+        # Get session
+        state = await interview_sessions.aget(session_id)
+        if not state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Interview session {session_id} not found"
+            )
 
-    if state.status == "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview is already completed"
-        )
+        if state.status == "completed":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Interview is already completed"
+            )
 
-    try:
-        # Submit answer
-        state.answers.append(request.answer)
+        try:
+            # Submit answer
+            state.answers.append(request.answer)
 
-        # Check if all answers have been submitted
-        all_answers_submitted = len(state.answers) >= state.total_questions
+            # Check if all answers have been submitted
+            all_answers_submitted = len(state.answers) >= state.total_questions
         
-        # Determine response status
-        response_status = "in_progress"
-        next_question = None
+            # Determine response status
+            response_status = "in_progress"
+            next_question = None
         
-        if all_answers_submitted:
-            # If all answers submitted, trigger bulk evaluation
-            if len(state.evaluations) < len(state.answers):
-                state = interview_workflow.evaluate_all_answers(state)
-                interview_sessions[session_id] = state
+            if all_answers_submitted:
+                # If all answers submitted, trigger bulk evaluation
+                if len(state.evaluations) < len(state.answers):
+                    state = await interview_workflow.evaluate_pending_answers(state)
+                    await interview_sessions.aset(session_id, state)
             
-            # Check if evaluations are complete
-            if len(state.evaluations) == len(state.answers):
-                response_status = "evaluated"
-        else:
-            # Generate next question
-            next_question = interviewer_agent.generate_next_question(state)
-            state.questions.append(next_question)
-            state.current_question_id = next_question.question_id
-            response_status = "in_progress"
+                # Check if evaluations are complete
+                if len(state.evaluations) == len(state.answers):
+                    response_status = "evaluated"
+            else:
+                if len(state.questions) > len(state.answers):
+                    # Next question was pre-generated at interview start
+                    next_question = state.questions[len(state.answers)]
+                else:
+                    # Generate next question
+                    next_question = interviewer_agent.generate_next_question(state)
+                    state.questions.append(next_question)
+                state.current_question_id = next_question.question_id
+                response_status = "in_progress"
             
-            # Synthesize audio if requested
-            if include_audio:
-                audio_data = await synthesize_audio_base64(next_question.question_text)
-                # Create question with audio data
-                next_question = Question(
-                    question_id=next_question.question_id,
-                    question_text=next_question.question_text,
-                    category=next_question.category,
-                    timestamp=next_question.timestamp,
-                    audio_data=audio_data
-                )
-
-        # Update stored session
-        interview_sessions[session_id] = state
-
-        questions_remaining = max(0, state.total_questions - len(state.answers))
-
-        # Get evaluation if available (only after bulk evaluation)
-        evaluation = None
-        if state.evaluations and len(state.evaluations) == len(state.answers):
-            # All evaluations complete, get the last one for display
-            latest_evaluation = state.evaluations[-1]
-            evaluation = latest_evaluation.scores
-
-        return AnswerResponse(
-            session_id=session_id,
-            question_answered=len(state.answers),
-            evaluation=evaluation,
-            next_question=next_question,
-            status=response_status,
-            total_questions=state.total_questions,
-            questions_remaining=questions_remaining
-        )
+                # Synthesize audio if requested
+                if include_audio:
+                    audio_data = await synthesize_audio_base64(next_question.question_text)
+                    # Copy question with audio data (no re-validation of the stored question)
+                    next_question = next_question.model_copy(
+                        update={"audio_data": audio_data, "audio_mime_type": tts_mime_type() if audio_data else None}
+                    )
+
+            # Update stored session
+            await interview_sessions.aset(session_id, state)
+
+            questions_remaining = max(0, state.total_questions - len(state.answers))
+
+            # Get evaluation if available (only after bulk evaluation)
+            evaluation = None
+            if state.evaluations and len(state.evaluations) == len(state.answers):
+                # All evaluations complete, get the last one for display
+                latest_evaluation = state.evaluations[-1]
+                evaluation = latest_evaluation.scores
+
+            return AnswerResponse(
+                session_id=session_id,
+                question_answered=len(state.answers),
+                evaluation=evaluation,
+                next_question=next_question,
+                status=response_status,
+                total_questions=state.total_questions,
+                questions_remaining=questions_remaining
+            )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process answer: {str(e)}"
-        )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to process answer: {str(e)}"
+            )
 
 
 @router.get("/{session_id}/feedback", response_model=FeedbackResponse)
@@ -187,48 +192,54 @@ async def get_feedback(session_id: str):
 
     Returns detailed analysis, scores, and improvement recommendations.
     """
-    # Get session
-    state = interview_sessions.get(session_id)
-    if not state:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Interview session {session_id} not found"
-        )
+    # Serialize with submissions: evaluation reads the session, awaits, then writes it back
+    async with interview_sessions.lock(session_id):
+        # Get session
+        state = await interview_sessions.aget(session_id)
+        if not state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Interview session {session_id} not found"
+            )
 
-    try:
-        # Generate feedback if not already done
-        if not state.final_feedback:
-            state = interview_workflow.get_feedback(state)
-            interview_sessions[session_id] = state
+        try:
+            # Generate feedback if not already done
+            if not state.final_feedback:
+                state = await interview_workflow.get_feedback(state)
+                await interview_sessions.aset(session_id, state)
 
-        if not state.final_feedback:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate feedback"
+            if not state.final_feedback:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to generate feedback"
+                )
+
+            # Calculate interview duration
+            if state.evaluations:
+                first_timestamp = state.questions[0].timestamp
+                last_timestamp = state.evaluations[-1].timestamp
+                duration = (last_timestamp - first_timestamp).total_seconds() / 60
+            else:
+                duration = None
+
+            response = FeedbackResponse(
+                session_id=session_id,
+                feedback=state.final_feedback,
+                all_evaluations=state.evaluations,
+                interview_duration_minutes=round(duration, 2) if duration else None
             )
 
-        # Calculate interview duration
-        if state.evaluations:
-            first_timestamp = state.questions[0].timestamp
-            last_timestamp = state.evaluations[-1].timestamp
-            duration = (last_timestamp - first_timestamp).total_seconds() / 60
-        else:
-            duration = None
-
-        return FeedbackResponse(
-            session_id=session_id,
-            feedback=state.final_feedback,
-            all_evaluations=state.evaluations,
-            interview_duration_minutes=round(duration, 2) if duration else None
-        )
+            # Serialize with the model's compiled serializer instead of letting FastAPI
+            # re-validate and re-encode the (potentially long) evaluation list
+            return Response(content=response.model_dump_json(), media_type="application/json")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get feedback: {str(e)}"
-        )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get feedback: {str(e)}"
+            )
 
 
 @router.get("/history", response_model=list[dict])
@@ -240,7 +251,7 @@ async def get_interview_history():
     """
     history = []
 
-    for session_id, state in interview_sessions.items():
+    for session_id, state in await interview_sessions.ascan():
         history.append({
             "session_id": session_id,
             "role": state.role,
@@ -265,39 +276,41 @@ async def complete_interview(session_id: str):
 
     Generates feedback based on questions answered so far.
     """
-    # Get session
-    state = interview_sessions.get(session_id)
-    if not state:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Interview session {session_id} not found"
-        )
+    # Serialize with submissions: evaluation reads the session, awaits, then writes it back
+    async with interview_sessions.lock(session_id):
+        # Get session
+        state = await interview_sessions.aget(session_id)
+        if not state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Interview session {session_id} not found"
+            )
 
-    if state.status == "completed":
-        return {"message": "Interview already completed", "session_id": session_id}
+        if state.status == "completed":
+            return {"message": "Interview already completed", "session_id": session_id}
 
-    if not state.answers:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot complete interview with no answers"
-        )
+        if not state.answers:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot complete interview with no answers"
+            )
 
-    try:
-        # Generate feedback
-        state = interview_workflow.get_feedback(state)
-        interview_sessions[session_id] = state
+        try:
+            # Generate feedback
+            state = await interview_workflow.get_feedback(state)
+            await interview_sessions.aset(session_id, state)
 
-        return {
-            "message": "Interview completed successfully",
-            "session_id": session_id,
-            "questions_answered": len(state.answers)
-        }
+            return {
+                "message": "Interview completed successfully",
+                "session_id": session_id,
+                "questions_answered": len(state.answers)
+            }
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to complete interview: {str(e)}"
-        )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to complete interview: {str(e)}"
+            )
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -307,11 +320,12 @@ async def delete_interview(session_id: str):
 
     Removes the session from memory.
     """
-    if session_id not in interview_sessions:
+    try:
+        await interview_sessions.adelete(session_id)
+    except KeyError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Interview session {session_id} not found"
         )
 
-    del interview_sessions[session_id]
     return None
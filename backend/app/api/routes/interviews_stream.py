@@ -9,13 +9,19 @@ from app.models.schemas import (
 )
 from app.graph.workflow import interview_workflow
 from app.agents.interviewer import interviewer_agent
+from app.agents.feedback import feedback_agent
 from app.config import settings
 from app.store import interview_sessions
-import json
+import orjson
 
 router = APIRouter(prefix="/api/interviews/stream", tags=["interviews-stream"])
 
 
+def _sse(payload: dict) -> bytes:
+    """Format a payload as a server-sent event (orjson-encoded)."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 @router.post("/start")
 async def start_interview_stream(request: StartInterviewRequest):
     """
@@ -34,7 +40,7 @@ async def start_interview_stream(request: StartInterviewRequest):
         )
 
         # Store session
-        interview_sessions[state.session_id] = state
+        await interview_sessions.aset(state.session_id, state)
 
         async def generate():
             nonlocal state
@@ -50,13 +56,13 @@ async def start_interview_stream(request: StartInterviewRequest):
                 "question_id": 1,
                 "category": "opening"
             }
-            yield f"data: {json.dumps(metadata)}\n\n"
+            yield _sse(metadata)
 
             # Stream the first question
             full_text = ""
             async for chunk in interviewer_agent.stream_first_question(state):
                 full_text += chunk
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                yield _sse({'type': 'chunk', 'content': chunk})
 
             # Add the streamed question to state using workflow helper
             state = interview_workflow.add_streamed_question(
@@ -67,9 +73,9 @@ async def start_interview_stream(request: StartInterviewRequest):
             )
             
             # Update stored session
-            interview_sessions[state.session_id] = state
+            await interview_sessions.aset(state.session_id, state)
 
-            yield f"data: {json.dumps({'type': 'done', 'question_text': full_text.strip()})}\n\n"
+            yield _sse({'type': 'done', 'question_text': full_text.strip()})
 
         return StreamingResponse(
             generate(),
@@ -96,8 +102,8 @@ async def submit_answer_stream(session_id: str, request: SubmitAnswerRequest):
     Stores the answer and streams the next question. When all answers are submitted,
     triggers bulk evaluation and returns completion status.
     """
-    # Get session
-    state = interview_sessions.get(session_id)
+    # Reject unknown or finished sessions up front (re-checked under the lock below)
+    state = await interview_sessions.aget(session_id)
     if not state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,76 +117,166 @@ async def submit_answer_stream(session_id: str, request: SubmitAnswerRequest):
         )
 
     try:
-        # Submit answer
-        state.answers.append(request.answer)
+        async def generate():
+            # Serialize submissions for the session: the read-modify-write below spans awaits
+            async with interview_sessions.lock(session_id):
+                # Re-read the session now that no other submission can change it
+                state = await interview_sessions.aget(session_id)
+                if not state:
+                    yield _sse({'type': 'error', 'detail': f"Interview session {session_id} not found"})
+                    return
+                if state.status == "completed":
+                    yield _sse({'type': 'error', 'detail': "Interview is already completed"})
+                    return
 
-        # Check if all answers have been submitted
-        all_answers_submitted = len(state.answers) >= state.total_questions
+                # Submit answer
+                state.answers.append(request.answer)
 
-        async def generate():
-            nonlocal state
-            if all_answers_submitted:
-                # Send metadata indicating completion
-                metadata = {
-                    "type": "metadata",
-                    "session_id": session_id,
-                    "question_answered": len(state.answers),
-                    "status": "evaluating",
-                    "total_questions": state.total_questions,
-                    "questions_remaining": 0,
-                    "all_completed": True
-                }
-                yield f"data: {json.dumps(metadata)}\n\n"
+                # Check if all answers have been submitted
+                all_answers_submitted = len(state.answers) >= state.total_questions
 
-                # Trigger bulk evaluation
-                if len(state.evaluations) < len(state.answers):
-                    evaluated_state = interview_workflow.evaluate_all_answers(state)
-                    interview_sessions[session_id] = evaluated_state
-                    
-                    # Send evaluation complete
-                    eval_data = {
-                        "type": "evaluation_complete",
-                        "status": "evaluated"
+                if all_answers_submitted:
+                    # Send metadata indicating completion
+                    metadata = {
+                        "type": "metadata",
+                        "session_id": session_id,
+                        "question_answered": len(state.answers),
+                        "status": "evaluating",
+                        "total_questions": state.total_questions,
+                        "questions_remaining": 0,
+                        "all_completed": True
                     }
-                    yield f"data: {json.dumps(eval_data)}\n\n"
+                    yield _sse(metadata)
+
+                    # Trigger bulk evaluation
+                    if len(state.evaluations) < len(state.answers):
+                        evaluated_state = await interview_workflow.evaluate_pending_answers(state)
+                        await interview_sessions.aset(session_id, evaluated_state)
+                    
+                        # Send evaluation complete
+                        eval_data = {
+                            "type": "evaluation_complete",
+                            "status": "evaluated"
+                        }
+                        yield _sse(eval_data)
                 
-                yield f"data: {json.dumps({'type': 'done'})}\n\n"
-            else:
-                # Generate next question
-                question_id = len(state.questions) + 1
-                category = interviewer_agent._determine_category(question_id, state.total_questions)
+                    yield _sse({'type': 'done'})
+                else:
+                    # Generate next question
+                    question_id = len(state.questions) + 1
+                    category = interviewer_agent._determine_category(question_id, state.total_questions)
+                
+                    # Send metadata
+                    metadata = {
+                        "type": "metadata",
+                        "session_id": session_id,
+                        "question_answered": len(state.answers),
+                        "status": "in_progress",
+                        "total_questions": state.total_questions,
+                        "questions_remaining": state.total_questions - len(state.answers),
+                        "question_id": question_id,
+                        "category": category
+                    }
+                    yield _sse(metadata)
+
+                    # Stream the next question
+                    full_text = ""
+                    async for chunk in interviewer_agent.stream_next_question(state):
+                        full_text += chunk
+                        yield _sse({'type': 'chunk', 'content': chunk})
+
+                    # Add the streamed question to state using workflow helper
+                    state = interview_workflow.add_streamed_question(
+                        state=state,
+                        question_text=full_text,
+                        question_id=question_id,
+                        category=category
+                    )
                 
+                    # Update stored session
+                    await interview_sessions.aset(session_id, state)
+
+                    yield _sse({'type': 'done', 'question_text': full_text.strip()})
+
+        return StreamingResponse(
+            generate(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no"
+            }
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process answer: {str(e)}"
+        )
+
+
+
+@router.get("/{session_id}/feedback")
+async def get_feedback_stream(session_id: str):
+    """
+    Stream comprehensive feedback for a completed interview.
+
+    Evaluates any pending answers, streams the feedback text as it is generated,
+    and finishes with the structured feedback once the stream is complete.
+    """
+    # Reject unknown or unanswered sessions up front (re-read under the lock below)
+    state = await interview_sessions.aget(session_id)
+    if not state:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Interview session {session_id} not found"
+        )
+
+    if not state.answers:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot generate feedback for an interview with no answers"
+        )
+
+    try:
+        async def generate():
+            # Serialize with submissions: evaluation and feedback read the session, await, then write it back
+            async with interview_sessions.lock(session_id):
+                state = await interview_sessions.aget(session_id)
+                if not state:
+                    yield _sse({'type': 'error', 'detail': f"Interview session {session_id} not found"})
+                    return
+
+                # Ensure all answers have been evaluated before streaming feedback
+                state = await interview_workflow.evaluate_pending_answers(state)
+                await interview_sessions.aset(session_id, state)
+
                 # Send metadata
                 metadata = {
                     "type": "metadata",
                     "session_id": session_id,
-                    "question_answered": len(state.answers),
-                    "status": "in_progress",
-                    "total_questions": state.total_questions,
-                    "questions_remaining": state.total_questions - len(state.answers),
-                    "question_id": question_id,
-                    "category": category
+                    "questions_answered": len(state.answers),
+                    "status": state.status
                 }
-                yield f"data: {json.dumps(metadata)}\n\n"
-
-                # Stream the next question
-                full_text = ""
-                async for chunk in interviewer_agent.stream_next_question(state):
-                    full_text += chunk
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
-
-                # Add the streamed question to state using workflow helper
-                state = interview_workflow.add_streamed_question(
-                    state=state,
-                    question_text=full_text,
-                    question_id=question_id,
-                    category=category
-                )
-                
-                # Update stored session
-                interview_sessions[session_id] = state
+                yield _sse(metadata)
+
+                if not state.final_feedback:
+                    # Stream the feedback text
+                    full_text = ""
+                    async for chunk in feedback_agent.stream_feedback(state):
+                        full_text += chunk
+                        yield _sse({'type': 'chunk', 'content': chunk})
+
+                    # Parse the streamed feedback into the state using workflow helper
+                    state = interview_workflow.add_streamed_feedback(state, full_text)
 
-                yield f"data: {json.dumps({'type': 'done', 'question_text': full_text.strip()})}\n\n"
+                    # Update stored session
+                    await interview_sessions.aset(session_id, state)
+
+                feedback = state.final_feedback.model_dump(mode="json")
+                yield _sse({'type': 'done', 'feedback': feedback})
 
         return StreamingResponse(
             generate(),
@@ -197,6 +293,5 @@ async def submit_answer_stream(session_id: str, request: SubmitAnswerRequest):
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process answer: {str(e)}"
+            detail=f"Failed to get feedback: {str(e)}"
         )
-
@@ -35,6 +35,7 @@ class Settings(BaseSettings):
     # Application Settings
     environment: str = "development"
     log_level: str = "INFO"
+    workers: int = 1  # Uvicorn worker processes (ignored when reloading)
 
     # LangSmith Tracing
     langsmith_tracing: str | None = None
@@ -48,12 +49,23 @@ class Settings(BaseSettings):
     # Interview Settings
     max_questions_per_interview: int = 10
     default_interview_duration_minutes: int = 30
+    session_store_path: str | None = None  # SQLite file sessions are written through to (survive restarts)
+    session_cache_size: int = 1024  # Sessions kept in memory when SESSION_STORE_PATH is set
+    pregenerate_questions: bool = False  # Generate all questions upfront in one LLM call (disables adaptive follow-ups)
+    fuzzy_use_lut: bool = False  # Approximate scores from 11x11 lookup tables (off by up to ~4 points near rule edges)
+    fuzzy_lut_cache_dir: str | None = "~/.cache/mock-interview-agent"  # Share the lookup tables across workers; None disables
+    scoring_cache_size: int = 1024  # Answer texts whose NLP features and scores are kept in memory
+    nlp_spacy_batch_size: int = 64  # Answers per spaCy nlp.pipe() batch when scoring several at once
+    nlp_threads: int | None = None  # Threads running spaCy off the event loop (default: CPU count)
+    nlp_eager: bool = False  # Load and warm up spaCy at server startup instead of on the first answer (gunicorn.conf.py always does)
 
     # CORS Settings
-    cors_allow_origins: str = "*"
+    cors_allow_origins: str = "http://localhost:3000"  # Explicit whitelist; "*" disables origin checks
+    cors_allow_origin_regex: str | None = None  # e.g. r"https://.*\.example\.com"
     cors_allow_credentials: bool = True
     cors_allow_methods: str = "*"
     cors_allow_headers: str = "*"
+    cors_max_age: int = 86400  # Seconds browsers may cache preflight responses
 
     # Voice Feature Settings
     enable_voice_features: bool = True
@@ -65,6 +77,16 @@ class Settings(BaseSettings):
     elevenlabs_voice_id: str = "21m00Tcm4TlvDq8ikWAM"
     elevenlabs_stability: float = 0.5
     elevenlabs_similarity_boost: float = 0.75
+    tts_max_concurrency: int = 4  # Concurrent TTS provider calls per process
+    tts_cache_size: int = 512  # Synthesized utterances kept in memory
+    tts_cache_dir: str | None = None  # Also persist synthesized audio here
+    tts_audio_format: Literal["mp3", "opus"] = "mp3"  # "opus" (Ogg, 32 kbps) is ~4x smaller than MP3 at 128 kbps
+
+    # Semantic LLM Cache Settings
+    enable_semantic_cache: bool = False  # Requires sentence-transformers and faiss-cpu
+    semantic_cache_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    semantic_cache_threshold: float = 0.92  # Minimum cosine similarity for a cache hit
+    semantic_cache_dir: str | None = None  # Persist the index here for warm starts
 
     def get_llm_config(self) -> dict:
         """Get LLM configuration based on the selected provider."""
@@ -3,19 +3,23 @@ LangGraph Workflow for orchestrating the interview process.
 Connects InterviewerAgent, EvaluatorAgent, and FeedbackAgent in a deliberative flow.
 """
 from typing import Literal
-from datetime import datetime
 from langgraph.graph import StateGraph, END
+from app.config import settings
 from app.models.schemas import InterviewState, Question
 from app.agents.interviewer import interviewer_agent
 from app.agents.evaluator import evaluator_agent
 from app.agents.feedback import feedback_agent
 
 
-# Define the workflow nodes
-def generate_question_node(state: InterviewState) -> InterviewState:
+# Define the workflow nodes (each returns a partial state update that LangGraph merges)
+def generate_question_node(state: InterviewState) -> dict:
     """
     Node: Generate the next interview question.
     """
+    if len(state.questions) > len(state.answers):
+        # Question was pre-generated at interview start, serve it from memory
+        return {"current_question_id": state.questions[len(state.answers)].question_id}
+
     if len(state.questions) == 0:
         # Generate first question
         question = interviewer_agent.generate_first_question(state)
@@ -23,18 +27,15 @@ def generate_question_node(state: InterviewState) -> InterviewState:
         # Generate follow-up question
         question = interviewer_agent.generate_next_question(state)
 
-    state.questions.append(question)
-    state.current_question_id = question.question_id
-
-    return state
+    return {"questions": [question], "current_question_id": question.question_id}
 
 
-def evaluate_answer_node(state: InterviewState) -> InterviewState:
+def evaluate_answer_node(state: InterviewState) -> dict:
     """
     Node: Evaluate the most recent answer.
     """
     if not state.answers:
-        return state
+        return {}
 
     # Get the last question and answer
     last_question = state.questions[-1]
@@ -42,20 +43,17 @@ def evaluate_answer_node(state: InterviewState) -> InterviewState:
 
     # Evaluate the answer
     evaluation = evaluator_agent.evaluate_answer(last_question, last_answer)
-    state.evaluations.append(evaluation)
 
-    return state
+    return {"evaluations": [evaluation]}
 
 
-def generate_feedback_node(state: InterviewState) -> InterviewState:
+def generate_feedback_node(state: InterviewState) -> dict:
     """
     Node: Generate final comprehensive feedback.
     """
     feedback = feedback_agent.generate_feedback(state)
-    state.final_feedback = feedback
-    state.status = "completed"
 
-    return state
+    return {"final_feedback": feedback, "status": "completed"}
 
 
 def should_continue(state: InterviewState) -> Literal["evaluate", "generate_feedback", "end"]:
@@ -63,11 +61,12 @@ def should_continue(state: InterviewState) -> Literal["evaluate", "generate_feed
     Conditional edge: Determine next step based on interview progress.
     """
     # If we have an answer that hasn't been evaluated yet
-    if len(state.answers) > len(state.evaluations):
+    answers = state.answers
+    if answers and len(answers) > len(state.evaluations):
         return "evaluate"
 
     # If we've reached the total number of questions
-    if state.current_question_id >= state.total_questions:
+    if state.is_finished:
         return "generate_feedback"
 
     # Otherwise, we're done with current cycle (waiting for next answer)
@@ -79,7 +78,7 @@ def after_evaluation(state: InterviewState) -> Literal["generate_question", "gen
     Conditional edge: After evaluation, decide whether to continue or finish.
     """
     # If we've reached the total number of questions, generate feedback
-    if state.current_question_id >= state.total_questions:
+    if state.is_finished:
         return "generate_feedback"
 
     # Otherwise, generate next question
@@ -156,8 +155,8 @@ class InterviewWorkflow:
         Returns:
             Initial interview state, with first question generated if generate_first_question=True
         """
-        # Create initial state
-        initial_state = InterviewState(
+        # Create initial state (inputs come from an already validated request)
+        initial_state = InterviewState.model_construct(
             role=role,
             seniority=seniority,
             focus_areas=focus_areas or [],
@@ -165,7 +164,11 @@ class InterviewWorkflow:
         )
 
         # Generate first question if requested
-        if generate_first_question:
+        if generate_first_question and settings.pregenerate_questions:
+            # Generate every question in a single LLM call; later turns are served from memory
+            initial_state.questions = interviewer_agent.generate_all_questions(initial_state)
+            initial_state.current_question_id = 1
+        elif generate_first_question:
             first_question = interviewer_agent.generate_first_question(initial_state)
             initial_state.questions.append(first_question)
             initial_state.current_question_id = first_question.question_id
@@ -211,7 +214,27 @@ class InterviewWorkflow:
 
         return state
 
-    def get_feedback(self, state: InterviewState) -> InterviewState:
+    async def evaluate_pending_answers(self, state: InterviewState) -> InterviewState:
+        """
+        Evaluate every answer that has not been evaluated yet.
+
+        Pending answers are scored together in a single batch, off the event loop.
+
+        Args:
+            state: Interview state
+
+        Returns:
+            State with an evaluation for every answer
+        """
+        evaluated = len(state.evaluations)
+        pending = list(zip(state.questions[evaluated:], state.answers[evaluated:]))
+        if pending:
+            evaluations = await evaluator_agent.aevaluate_batch(pending)
+            state.evaluations.extend(evaluations)
+
+        return state
+
+    async def get_feedback(self, state: InterviewState) -> InterviewState:
         """
         Get final feedback for a completed interview.
 
@@ -225,11 +248,10 @@ class InterviewWorkflow:
             return state
 
         # Ensure all answers have been evaluated
-        if len(state.evaluations) < len(state.answers):
-            state = self.evaluate_all_answers(state)
+        state = await self.evaluate_pending_answers(state)
 
         # Generate feedback
-        state = generate_feedback_node(state)
+        state = state.model_copy(update=generate_feedback_node(state))
 
         return state
 
@@ -255,13 +277,27 @@ class InterviewWorkflow:
         question = Question(
             question_id=question_id,
             question_text=question_text.strip(),
-            category=category,
-            timestamp=datetime.utcnow()
+            category=category
         )
         state.questions.append(question)
         state.current_question_id = question.question_id
         return state
 
+    def add_streamed_feedback(self, state: InterviewState, feedback_text: str) -> InterviewState:
+        """
+        Add feedback that was streamed to the state and complete the interview.
+
+        Args:
+            state: Current interview state
+            feedback_text: The full text of the streamed feedback
+
+        Returns:
+            Updated state with final feedback and completed status
+        """
+        state.final_feedback = feedback_agent.parse_feedback(feedback_text, state)
+        state.status = "completed"
+        return state
+
 
 # Singleton instance
 interview_workflow = InterviewWorkflow()
@@ -0,0 +1,213 @@
+"""
+Semantic cache for LLM responses.
+Embeds prompts with a local SentenceTransformer model and serves a cached response
+when a previously seen prompt is semantically equivalent (cosine similarity above threshold).
+"""
+import base64
+import hashlib
+import json
+import pathlib
+import threading
+import numpy as np
+from app.config import settings
+from app.prompts.interview import DYNAMIC_CONTEXT_HEADER
+
+
+class SemanticCache:
+    """Embedding-based cache of prompt -> LLM response backed by FAISS inner-product indexes."""
+
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float = 0.92,
+        cache_dir: str | None = None
+    ):
+        """Initialize the cache. Lazy-loads the embedding model and indexes when needed."""
+        self.model_name = model_name
+        self.threshold = threshold
+        self.cache_dir = pathlib.Path(cache_dir) if cache_dir else None
+        self._model = None
+        # One (index, responses) pair per static prompt prefix, so different prompt types never match
+        self._namespaces: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        # Serializes appends to the on-disk logs without blocking lookups on self._lock
+        self._file_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """Lazy-load the embedding model."""
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:
+                    raise ImportError(
+                        "Semantic cache requires sentence-transformers and faiss. "
+                        "Install with: pip install sentence-transformers faiss-cpu"
+                    )
+                self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def _split(self, prompt: str) -> tuple[str, str]:
+        """
+        Split a prompt into its namespace key and the text to embed.
+
+        Prompts put static instructions before DYNAMIC_CONTEXT_HEADER; only the dynamic
+        context is embedded (the static prefix would otherwise dominate the embedding),
+        and the static prefix selects the namespace.
+        """
+        static, header, context = prompt.partition(DYNAMIC_CONTEXT_HEADER)
+        if not header:
+            static, context = "", prompt
+        return hashlib.sha1(static.encode("utf-8")).hexdigest()[:16], context
+
+    def _namespace(self, key: str) -> tuple:
+        """Get (or create / restore from disk) the FAISS index and responses for a namespace."""
+        if key not in self._namespaces:
+            import faiss
+
+            # Inner product over L2-normalized vectors == cosine similarity
+            index = faiss.IndexFlatIP(self.model.get_sentence_embedding_dimension())
+            responses = []
+            embeddings = []
+            for embedding, response in self._load(key):
+                embeddings.append(embedding)
+                responses.append(response)
+            if embeddings:
+                index.add(np.vstack(embeddings))
+            self._namespaces[key] = (index, responses)
+        return self._namespaces[key]
+
+    def _path(self, key: str) -> pathlib.Path | None:
+        """Get the on-disk log of a namespace's embeddings and responses."""
+        if not self.cache_dir:
+            return None
+        return self.cache_dir / f"{key}.jsonl"
+
+    def _load(self, key: str) -> list[tuple]:
+        """Read a namespace's (embedding, response) entries back from its log, skipping a torn last line."""
+        path = self._path(key)
+        if not path or not path.exists():
+            return []
+
+        entries = []
+        with path.open(encoding="utf-8") as log:
+            for line in log:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                embedding = np.frombuffer(base64.b64decode(entry["embedding"]), dtype="float32")
+                entries.append((embedding.reshape(1, -1), entry["response"]))
+        return entries
+
+    def _embed(self, text: str):
+        """Embed text as a normalized float32 row vector (called outside the lock so callers encode in parallel)."""
+        return self.model.encode([text], normalize_embeddings=True, convert_to_numpy=True).astype("float32")
+
+    def _search(self, key: str, embedding) -> str | None:
+        """Find the cached response closest to an embedding within a namespace, if above the threshold."""
+        with self._lock:
+            index, responses = self._namespace(key)
+            if index.ntotal == 0:
+                return None
+
+            scores, ids = index.search(embedding, 1)
+            if ids[0][0] >= 0 and scores[0][0] > self.threshold:
+                return responses[ids[0][0]]
+            return None
+
+    def _add(self, key: str, embedding, response: str) -> None:
+        """Add an embedded prompt's response to a namespace and persist it."""
+        with self._lock:
+            index, responses = self._namespace(key)
+            index.add(embedding)
+            responses.append(response)
+        self._persist(key, embedding, response)
+
+    def get(self, prompt: str) -> str | None:
+        """
+        Look up a cached response for a semantically equivalent prompt.
+
+        Args:
+            prompt: The prompt about to be sent to the LLM
+
+        Returns:
+            The cached response text, or None on a cache miss
+        """
+        key, context = self._split(prompt)
+        return self._search(key, self._embed(context))
+
+    def set(self, prompt: str, response: str) -> None:
+        """
+        Store an LLM response for a prompt and append it to disk if a cache directory is configured.
+
+        Args:
+            prompt: The prompt sent to the LLM
+            response: The LLM response text
+        """
+        key, context = self._split(prompt)
+        self._add(key, self._embed(context), response)
+
+    def invoke(self, llm, prompt: str) -> str:
+        """
+        Return the cached response for a prompt, calling the LLM only on a cache miss.
+
+        Args:
+            llm: LangChain chat model to call on a miss
+            prompt: The prompt to send
+
+        Returns:
+            The (possibly cached) response text
+        """
+        # Embed once: the same vector is used for the lookup and, on a miss, for the insert
+        key, context = self._split(prompt)
+        embedding = self._embed(context)
+
+        cached = self._search(key, embedding)
+        if cached is not None:
+            return cached
+
+        response = llm.invoke(prompt).content.strip()
+        self._add(key, embedding, response)
+        return response
+
+    def _persist(self, key: str, embedding, response: str):
+        """Append one entry to a namespace's log for warm starts (outside the lookup lock, O(1) per miss)."""
+        path = self._path(key)
+        if not path:
+            return
+
+        line = json.dumps({
+            "embedding": base64.b64encode(embedding.tobytes()).decode("ascii"),
+            "response": response
+        }, ensure_ascii=False)
+        with self._file_lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as log:
+                log.write(line + "\n")
+
+
+def invoke_llm(llm, prompt: str) -> str:
+    """
+    Invoke an LLM with a prompt, going through the semantic cache when enabled.
+
+    Args:
+        llm: LangChain chat model
+        prompt: The prompt to send
+
+    Returns:
+        The response text, stripped of surrounding whitespace
+    """
+    if semantic_cache is None:
+        return llm.invoke(prompt).content.strip()
+    return semantic_cache.invoke(llm, prompt)
+
+
+# Singleton instance (None when the semantic cache is disabled)
+semantic_cache = SemanticCache(
+    model_name=settings.semantic_cache_model,
+    threshold=settings.semantic_cache_threshold,
+    cache_dir=settings.semantic_cache_dir
+) if settings.enable_semantic_cache else None
@@ -1,10 +1,23 @@
 """
 Main FastAPI application for Mock Interview Agent.
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import interviews, interviews_stream
 from app.config import settings
+from app.services.nlp_service import nlp_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally load and warm up spaCy when the server starts rather than on the first answer."""
+    # gunicorn.conf.py already preloads in the master process before forking workers
+    if settings.nlp_eager:
+        nlp_service.preload()
+    yield
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -12,16 +25,20 @@ app = FastAPI(
     description="AI-powered interview training agent using LangGraph, NLP, and Fuzzy Logic",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
+    allow_origin_regex=settings.cors_allow_origin_regex,
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_methods_list,
     allow_headers=settings.cors_headers_list,
+    max_age=settings.cors_max_age,
 )
 
 # Include routers
@@ -62,5 +79,6 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.environment == "development"
+        reload=settings.environment == "development",
+        workers=settings.workers
     )
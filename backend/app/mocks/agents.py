@@ -1,3 +1,6 @@
+import functools
+import itertools
+import threading
 from typing import Iterator, AsyncIterator
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import BaseMessage, AIMessage, HumanMessage, AIMessageChunk
@@ -5,6 +8,30 @@ from langchain_core.outputs import ChatGeneration, ChatResult
 from langchain_core.callbacks import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
 
 
+@functools.singledispatch
+def _to_messages(input) -> list[BaseMessage]:
+    """Convert a chat model input (string, message list or single message) to a message list."""
+    return [input]
+
+
+@_to_messages.register
+def _(input: str) -> list[BaseMessage]:
+    return [HumanMessage(content=input)]
+
+
+@_to_messages.register
+def _(input: list) -> list[BaseMessage]:
+    return input
+
+
+def _to_ai_message(result: ChatResult) -> AIMessage:
+    """Extract the AIMessage from a ChatResult."""
+    if result.generations and result.generations[0].message:
+        return result.generations[0].message
+    # Fallback: create AIMessage from first generation
+    return AIMessage(content=result.generations[0].text if result.generations else "")
+
+
 class MockChatModel(BaseChatModel):
     """Mock chat model that returns predefined responses in rotation."""
     
@@ -13,28 +40,29 @@ class MockChatModel(BaseChatModel):
         # Use object.__setattr__ to bypass Pydantic validation for these fields
         # since BaseChatModel is a Pydantic model and doesn't allow arbitrary attributes
         object.__setattr__(self, 'responses', responses)
-        object.__setattr__(self, '_current_index', 0)
+        # Rotate through response indices; the lock keeps concurrent calls from getting the same response
+        object.__setattr__(self, '_cycle', itertools.cycle(range(len(responses))))
+        object.__setattr__(self, '_lock', threading.Lock())
+        # Pre-split each response into streaming chunks ("word", " word", ...) once
+        # instead of re-tokenizing the same text on every stream call
+        object.__setattr__(self, '_chunk_lists', [
+            [word if i == 0 else f" {word}" for i, word in enumerate(response.split())]
+            for response in responses
+        ])
     
+    def _next_index(self) -> int:
+        """Get the index of the next response in rotation (thread-safe)."""
+        with self._lock:
+            return next(self._cycle)
+
     def invoke(self, input, config=None, **kwargs):
         """
         Override invoke to handle both string and message list inputs.
         Ensures we always return an AIMessage with .content attribute.
         """
-        # Convert string to HumanMessage if needed
-        if isinstance(input, str):
-            messages = [HumanMessage(content=input)]
-        elif isinstance(input, list):
-            messages = input
-        else:
-            messages = [input]
-        
         # Call _generate directly and extract the AIMessage
-        result = self._generate(messages, **kwargs)
-        # Extract AIMessage from ChatResult
-        if result.generations and result.generations[0].message:
-            return result.generations[0].message
-        # Fallback: create AIMessage from first generation
-        return AIMessage(content=result.generations[0].text if result.generations else "")
+        result = self._generate(_to_messages(input), **kwargs)
+        return _to_ai_message(result)
     
     def _generate(
         self,
@@ -44,8 +72,7 @@ class MockChatModel(BaseChatModel):
         **kwargs,
     ) -> ChatResult:
         # Get the next response in rotation
-        response_text = self.responses[self._current_index % len(self.responses)]
-        self._current_index += 1
+        response_text = self.responses[self._next_index()]
         
         # Create an AIMessage with the response
         message = AIMessage(content=response_text)
@@ -68,21 +95,9 @@ class MockChatModel(BaseChatModel):
         Override ainvoke to handle both string and message list inputs.
         Ensures we always return an AIMessage with .content attribute.
         """
-        # Convert string to HumanMessage if needed
-        if isinstance(input, str):
-            messages = [HumanMessage(content=input)]
-        elif isinstance(input, list):
-            messages = input
-        else:
-            messages = [input]
-        
         # Call _agenerate directly and extract the AIMessage
-        result = await self._agenerate(messages, **kwargs)
-        # Extract AIMessage from ChatResult
-        if result.generations and result.generations[0].message:
-            return result.generations[0].message
-        # Fallback: create AIMessage from first generation
-        return AIMessage(content=result.generations[0].text if result.generations else "")
+        result = await self._agenerate(_to_messages(input), **kwargs)
+        return _to_ai_message(result)
     
     @property
     def _llm_type(self) -> str:
@@ -95,15 +110,12 @@ class MockChatModel(BaseChatModel):
         run_manager: CallbackManagerForLLMRun | None = None,
         **kwargs,
     ) -> Iterator[AIMessageChunk]:
-        # Get the next response in rotation
-        response_text = self.responses[self._current_index % len(self.responses)]
-        self._current_index += 1
+        # Get the next pre-split response in rotation
+        chunks = self._chunk_lists[self._next_index()]
         
         # Stream the response word by word to simulate real streaming
         # Use AIMessageChunk for streaming chunks
-        words = response_text.split()
-        for i, word in enumerate(words):
-            content = word if i == 0 else f" {word}"
+        for content in chunks:
             yield AIMessageChunk(content=content)
     
     async def astream(self, input, config=None, **kwargs):
@@ -111,16 +123,8 @@ class MockChatModel(BaseChatModel):
         Override astream to handle both string and message list inputs.
         Ensures compatibility with LangChain's astream wrapper.
         """
-        # Convert string to HumanMessage if needed
-        if isinstance(input, str):
-            messages = [HumanMessage(content=input)]
-        elif isinstance(input, list):
-            messages = input
-        else:
-            messages = [input]
-        
         # Call _astream and yield chunks directly (bypassing base class wrapper)
-        async for chunk in self._astream(messages, **kwargs):
+        async for chunk in self._astream(_to_messages(input), **kwargs):
             yield chunk
     
     async def _astream(
@@ -130,15 +134,12 @@ class MockChatModel(BaseChatModel):
         run_manager: AsyncCallbackManagerForLLMRun | None = None,
         **kwargs,
     ) -> AsyncIterator[AIMessageChunk]:
-        # Get the next response in rotation
-        response_text = self.responses[self._current_index % len(self.responses)]
-        self._current_index += 1
+        # Get the next pre-split response in rotation
+        chunks = self._chunk_lists[self._next_index()]
         
         # Stream the response word by word to simulate real streaming
         # Use AIMessageChunk for streaming chunks
-        words = response_text.split()
-        for i, word in enumerate(words):
-            content = word if i == 0 else f" {word}"
+        for content in chunks:
             yield AIMessageChunk(content=content)
 
 
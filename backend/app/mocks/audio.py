@@ -1,15 +1,12 @@
 import pathlib
 
+# Read example.mp3 (in the same directory) once at import; bytes are immutable so sharing across requests is safe
+_AUDIO_BYTES = (pathlib.Path(__file__).parent / "example.mp3").read_bytes()
+
 
 def generate_mock_audio_bytes() -> bytes:
     """
-    Read and return the example.mp3 audio file bytes.
+    Return the example.mp3 audio file bytes.
     This provides a real MP3 audio file for mock TTS responses.
     """
-    # Get the path to example.mp3 in the same directory
-    current_dir = pathlib.Path(__file__).parent
-    audio_file = current_dir / "example.mp3"
-    
-    # Read and return the audio file bytes
-    with open(audio_file, "rb") as f:
-        return f.read()
+    return _AUDIO_BYTES
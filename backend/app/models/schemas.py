@@ -1,10 +1,21 @@
 """
 Pydantic models for the Mock Interview Agent API.
 """
-from datetime import datetime
-from typing import Literal
+import operator
+from datetime import datetime, timezone
+from typing import Annotated, Literal
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer
+
+
+def utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+# Full-precision floats that are rounded only when serialized
+Rounded2 = Annotated[float, PlainSerializer(lambda value: round(value, 2), return_type=float)]
+Rounded3 = Annotated[float, PlainSerializer(lambda value: round(value, 3), return_type=float)]
 
 
 # ============================================================================
@@ -32,8 +43,9 @@ class Question(BaseModel):
     question_id: int = Field(..., description="Sequential question number")
     question_text: str = Field(..., description="The interview question")
     category: str | None = Field(None, description="Category of the question (e.g., technical, behavioral)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     audio_data: str | None = Field(None, description="Base64-encoded audio data for the question (if voice features enabled)")
+    audio_mime_type: str | None = Field(None, description="MIME type of audio_data (e.g., audio/mpeg, audio/ogg; codecs=opus)")
 
 
 class EvaluationScore(BaseModel):
@@ -50,7 +62,7 @@ class AnswerEvaluation(BaseModel):
     answer_text: str
     scores: EvaluationScore
     nlp_features: dict = Field(default_factory=dict, description="Extracted NLP features")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 class FeedbackItem(BaseModel):
@@ -79,7 +91,7 @@ class InterviewSessionResponse(BaseModel):
     current_question: Question
     total_questions: int
     status: Literal["in_progress", "completed"] = "in_progress"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
 
 
 class AnswerResponse(BaseModel):
@@ -115,28 +127,40 @@ class InterviewState(BaseModel):
     # Interview progress
     current_question_id: int = 0
     total_questions: int = 10
-    questions: list[Question] = Field(default_factory=list)
-    answers: list[str] = Field(default_factory=list)
-    evaluations: list[AnswerEvaluation] = Field(default_factory=list)
+    # Reducers let LangGraph nodes return only the new items, which are appended to the lists
+    questions: Annotated[list[Question], operator.add] = Field(default_factory=list)
+    answers: Annotated[list[str], operator.add] = Field(default_factory=list)
+    evaluations: Annotated[list[AnswerEvaluation], operator.add] = Field(default_factory=list)
 
     # Final feedback (populated at end)
     final_feedback: InterviewFeedback | None = None
 
     # Status tracking
     status: Literal["in_progress", "completed"] = "in_progress"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the interview has reached its last question."""
+        return self.current_question_id >= self.total_questions
 
-    model_config = {"arbitrary_types_allowed": True}
+    # State is mutated in place between workflow steps; never re-validate the growing
+    # questions/answers/evaluations lists when the instance is passed around
+    model_config = {
+        "arbitrary_types_allowed": True,
+        "revalidate_instances": "never",
+        "validate_assignment": False,
+    }
 
 
 class NLPFeatures(BaseModel):
     """Extracted NLP features from an answer."""
     word_count: int = 0
     sentence_count: int = 0
-    avg_sentence_length: float = 0.0
-    sentiment_score: float = 0.0  # -1 to 1
+    avg_sentence_length: Rounded2 = 0.0
+    sentiment_score: Rounded3 = 0.0  # -1 to 1
     confidence_indicators: int = 0  # Count of confident language
     filler_words_count: int = 0  # "um", "uh", "like", etc.
     technical_terms_count: int = 0
-    coherence_score: float = 0.0  # 0 to 1
-    complexity_score: float = 0.0  # Based on vocabulary
+    coherence_score: Rounded3 = 0.0  # 0 to 1
+    complexity_score: Rounded3 = 0.0  # Based on vocabulary
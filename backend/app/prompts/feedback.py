@@ -1,19 +1,11 @@
 from app.models.schemas import InterviewState, Question, AnswerEvaluation
+from app.prompts.interview import DYNAMIC_CONTEXT_HEADER
 
-def get_feedback_prompt(state: InterviewState, overall_score: float, qa_history: str) -> str:
-    """Get the feedback prompt for the given state."""
-    prompt = f"""Eres un coach experto de entrevistas proporcionando retroalimentación integral sobre una entrevista simulada.
+# Static instructions and response format come first so every feedback prompt shares an
+# identical prefix that providers can serve from their prompt cache; the transcript goes last.
+FEEDBACK_SYSTEM_PREFIX = """Eres un coach experto de entrevistas proporcionando retroalimentación integral sobre una entrevista simulada.
 
-Detalles de la Entrevista:
-- Puesto: {state.role}
-- Nivel de Antigüedad: {state.seniority}
-- Total de Preguntas: {len(state.questions)}
-- Puntuación General: {overall_score}/10
-
-Transcripción Completa de la Entrevista con Evaluaciones:
-{qa_history}
-
-Basándote en el desempeño de esta entrevista, proporciona retroalimentación detallada y accionable en el siguiente formato EN ESPAÑOL:
+Basándote en el desempeño de la entrevista (contexto y transcripción al final), proporciona retroalimentación detallada y accionable en el siguiente formato EN ESPAÑOL:
 
 ## RESUMEN GENERAL
 [2-3 oraciones resumiendo el desempeño general del candidato]
@@ -59,6 +51,20 @@ Sugerencias:
 
 Mantén la retroalimentación constructiva, específica y accionable. Enfócate en ejemplos concretos de sus respuestas. Responde TODO en español."""
 
+
+def get_feedback_prompt(state: InterviewState, overall_score: float, qa_history: str) -> str:
+    """Get the feedback prompt for the given state."""
+    prompt = f"""{FEEDBACK_SYSTEM_PREFIX}
+
+{DYNAMIC_CONTEXT_HEADER}
+- Puesto: {state.role}
+- Nivel de Antigüedad: {state.seniority}
+- Total de Preguntas: {len(state.answers)}
+- Puntuación General: {overall_score}/10
+
+Transcripción Completa de la Entrevista con Evaluaciones:
+{qa_history}"""
+
     return prompt
 
 
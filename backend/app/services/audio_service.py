@@ -1,11 +1,259 @@
 import io
+import asyncio
 import base64
+import hashlib
+import pathlib
+import threading
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 from app.config import settings
 from app.mocks.audio import generate_mock_audio_bytes
 
-def synthesize_elevenlabs(text: str, voice_id: str | None = None) -> StreamingResponse:
+# Provider SDKs are optional (mock TTS needs neither); import once here rather than per request
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from elevenlabs import VoiceSettings
+    from elevenlabs.client import AsyncElevenLabs
+except ImportError:
+    VoiceSettings = AsyncElevenLabs = None
+
+# In-memory LRU of synthesized audio bytes (and their memoized base64), keyed by _tts_cache_key
+_tts_cache: OrderedDict[str, bytes] = OrderedDict()
+_tts_b64_cache: OrderedDict[str, str] = OrderedDict()
+_tts_cache_lock = threading.Lock()
+
+# Async provider clients, created on first use and shared so connections are pooled across requests
+_openai_client = None
+_elevenlabs_client = None
+
+# Caps concurrent TTS provider calls to stay within rate limits
+_tts_semaphore = asyncio.Semaphore(settings.tts_max_concurrency)
+
+# Per codec: (ElevenLabs output_format, OpenAI response_format, MIME type, file extension)
+AUDIO_FORMATS = {
+    "mp3": ("mp3_44100_128", "mp3", "audio/mpeg", "mp3"),
+    "opus": ("opus_48000_32", "opus", "audio/ogg; codecs=opus", "ogg"),
+}
+
+
+def tts_audio_format() -> str:
+    """Get the codec of synthesized audio (mock audio is always MP3)."""
+    if settings.use_mock_tts or settings.tts_provider == "mock":
+        return "mp3"
+    return settings.tts_audio_format
+
+
+def tts_mime_type() -> str:
+    """Get the MIME type of synthesized audio."""
+    return AUDIO_FORMATS[tts_audio_format()][2]
+
+
+def _tts_cache_key(provider: str, model: str, voice: str, text: str) -> str:
+    """Build the cache key for a synthesized utterance."""
+    return hashlib.sha256(f"{provider}|{model}|{voice}|{settings.tts_audio_format}|{text}".encode("utf-8")).hexdigest()
+
+
+def _audio_response(audio_stream) -> StreamingResponse:
+    """Wrap synthesized audio in a streaming response with the configured codec's headers."""
+    _, _, media_type, extension = AUDIO_FORMATS[tts_audio_format()]
+    return StreamingResponse(
+        audio_stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=speech.{extension}"}
+    )
+
+
+def _lru_put(cache: OrderedDict, key: str, value) -> None:
+    """Insert a value into a bounded LRU, evicting the least recently used entry."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > settings.tts_cache_size:
+        cache.popitem(last=False)
+
+
+def _tts_cache_path(key: str) -> pathlib.Path:
+    """Get the on-disk location of a cached utterance."""
+    return pathlib.Path(settings.tts_cache_dir) / f"{key}.{AUDIO_FORMATS[settings.tts_audio_format][3]}"
+
+
+def _read_cached_audio(path: pathlib.Path) -> bytes | None:
+    """Read a cached utterance from disk (blocking; run in a thread)."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _write_cached_audio(path: pathlib.Path, audio_bytes: bytes) -> None:
+    """Write a cached utterance to disk (blocking; run in a thread)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(audio_bytes)
+
+
+async def _tts_cache_get(key: str) -> bytes | None:
+    """Look up synthesized audio in memory, then on disk (off the event loop) if a cache directory is configured."""
+    with _tts_cache_lock:
+        audio_bytes = _tts_cache.get(key)
+        if audio_bytes is not None:
+            _tts_cache.move_to_end(key)
+            return audio_bytes
+
+    if settings.tts_cache_dir:
+        audio_bytes = await asyncio.to_thread(_read_cached_audio, _tts_cache_path(key))
+        if audio_bytes is not None:
+            with _tts_cache_lock:
+                _lru_put(_tts_cache, key, audio_bytes)
+            return audio_bytes
+    return None
+
+
+async def _tts_cache_put(key: str, audio_bytes: bytes) -> None:
+    """Store synthesized audio in memory and on disk (off the event loop) if a cache directory is configured."""
+    with _tts_cache_lock:
+        _lru_put(_tts_cache, key, audio_bytes)
+
+    if settings.tts_cache_dir:
+        await asyncio.to_thread(_write_cached_audio, _tts_cache_path(key), audio_bytes)
+
+
+async def _cached_synthesis(key: str, synthesize: Callable[[], Awaitable[bytes]]) -> bytes:
+    """Return cached audio for a key, calling the provider only on a cache miss."""
+    audio_bytes = await _tts_cache_get(key)
+    if audio_bytes is None:
+        async with _tts_semaphore:
+            audio_bytes = await synthesize()
+        await _tts_cache_put(key, audio_bytes)
+    return audio_bytes
+
+
+def _cached_base64(key: str, audio_bytes: bytes) -> str:
+    """Base64-encode audio once per cache key."""
+    with _tts_cache_lock:
+        encoded = _tts_b64_cache.get(key)
+        if encoded is not None:
+            _tts_b64_cache.move_to_end(key)
+            return encoded
+
+    encoded = base64.b64encode(audio_bytes).decode('utf-8')
+    with _tts_cache_lock:
+        _lru_put(_tts_b64_cache, key, encoded)
+    return encoded
+
+
+def _pooled_http_client():
+    """Create an HTTP/2 client that keeps TLS connections alive across provider calls."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+
+
+def _get_openai_client():
+    """Get the shared AsyncOpenAI client."""
+    global _openai_client
+    if _openai_client is None:
+        if AsyncOpenAI is None:
+            raise ImportError("openai is not installed. Install with: pip install openai")
+        _openai_client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=_pooled_http_client())
+    return _openai_client
+
+
+def _get_elevenlabs_client():
+    """Get the shared AsyncElevenLabs client."""
+    global _elevenlabs_client
+    if _elevenlabs_client is None:
+        if AsyncElevenLabs is None:
+            raise ImportError("elevenlabs is not installed. Install with: pip install elevenlabs")
+        _elevenlabs_client = AsyncElevenLabs(api_key=settings.elevenlabs_api_key, httpx_client=_pooled_http_client())
+    return _elevenlabs_client
+
+
+def _elevenlabs_stream(text: str, voice: str) -> AsyncIterator[bytes]:
+    """Start an ElevenLabs synthesis and return its audio chunk stream."""
+    client = _get_elevenlabs_client()
+
+    # Generate audio using text_to_speech.convert
+    return client.text_to_speech.convert(
+        text=text,
+        voice_id=voice,
+        model_id=settings.elevenlabs_model,
+        output_format=AUDIO_FORMATS[settings.tts_audio_format][0],
+        voice_settings=VoiceSettings(
+            stability=settings.elevenlabs_stability,
+            similarity_boost=settings.elevenlabs_similarity_boost,
+        )
+    )
+
+
+async def _elevenlabs_tts(text: str, voice: str) -> bytes:
+    """Call the ElevenLabs API and return the audio bytes."""
+    # Collect the async chunk stream into one buffer
+    audio_bytes = bytearray()
+    async for chunk in _elevenlabs_stream(text, voice):
+        audio_bytes.extend(chunk)
+    return bytes(audio_bytes)
+
+
+async def _relay_elevenlabs_stream(key: str, text: str, voice: str) -> AsyncIterator[bytes]:
+    """
+    Start an ElevenLabs stream that relays chunks as they arrive and caches the full audio once complete.
+
+    The first chunk is awaited before returning so provider errors surface before a response starts.
+
+    Args:
+        key: TTS cache key for the utterance
+        text: Text to synthesize
+        voice: ElevenLabs voice ID
+
+    Returns:
+        Async iterator over the audio chunks
+    """
+    await _tts_semaphore.acquire()
+    try:
+        audio_stream = _elevenlabs_stream(text, voice)
+        first_chunk = await anext(audio_stream)
+    except BaseException:
+        _tts_semaphore.release()
+        raise
+
+    async def relay():
+        audio_bytes = bytearray(first_chunk)
+        try:
+            yield first_chunk
+            async for chunk in audio_stream:
+                audio_bytes.extend(chunk)
+                yield chunk
+            await _tts_cache_put(key, bytes(audio_bytes))
+        finally:
+            _tts_semaphore.release()
+
+    return relay()
+
+
+async def _openai_tts(text: str) -> bytes:
+    """Call the OpenAI TTS API and return the audio bytes."""
+    client = _get_openai_client()
+    response = await client.audio.speech.create(
+        model="tts-1",
+        voice="alloy",
+        input=text,
+        response_format=AUDIO_FORMATS[settings.tts_audio_format][1]
+    )
+    return response.content
+
+
+async def synthesize_elevenlabs(text: str, voice_id: str | None = None) -> StreamingResponse:
     """Synthesize speech using ElevenLabs API."""
     # Check for mock mode
     if settings.use_mock_tts or settings.tts_provider == "mock":
@@ -17,33 +265,16 @@ def synthesize_elevenlabs(text: str, voice_id: str | None = None) -> StreamingRe
         )
     
     try:
-        from elevenlabs import VoiceSettings
-        from elevenlabs.client import ElevenLabs
-        
-        client = ElevenLabs(api_key=settings.elevenlabs_api_key)
-        
         # Use provided voice_id or default
         voice = voice_id or settings.elevenlabs_voice_id
         
-        # Generate audio using text_to_speech.convert
-        audio_stream = client.text_to_speech.convert(
-            text=text,
-            voice_id=voice,
-            model_id=settings.elevenlabs_model,
-            voice_settings=VoiceSettings(
-                stability=settings.elevenlabs_stability,
-                similarity_boost=settings.elevenlabs_similarity_boost,
-            )
-        )
+        key = _tts_cache_key("elevenlabs", settings.elevenlabs_model, voice, text)
+        audio_bytes = await _tts_cache_get(key)
         
-        # Convert generator to bytes
-        audio_bytes = b"".join(audio_stream)
+        # On a cache miss, send chunks to the client as ElevenLabs produces them
+        audio_stream = io.BytesIO(audio_bytes) if audio_bytes is not None else await _relay_elevenlabs_stream(key, text, voice)
         
-        return StreamingResponse(
-            io.BytesIO(audio_bytes),
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": "attachment; filename=speech.mp3"}
-        )
+        return _audio_response(audio_stream)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"TTS generation failed: {str(e)}")
@@ -61,21 +292,10 @@ async def _synthesize_openai(text: str) -> StreamingResponse:
         )
     
     try:
-        from openai import OpenAI
-        
-        client = OpenAI(api_key=settings.openai_api_key)
-        
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice="alloy",
-            input=text
-        )
+        key = _tts_cache_key("openai", "tts-1", "alloy", text)
+        audio_bytes = await _cached_synthesis(key, lambda: _openai_tts(text))
         
-        return StreamingResponse(
-            io.BytesIO(response.content),
-            media_type="audio/mpeg",
-            headers={"Content-Disposition": "attachment; filename=speech.mp3"}
-        )
+        return _audio_response(io.BytesIO(audio_bytes))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"TTS generation failed: {str(e)}")
@@ -84,15 +304,13 @@ async def _synthesize_openai(text: str) -> StreamingResponse:
 async def _transcribe_openai(audio_bytes: bytes, filename: str) -> dict:
     """Transcribe audio using OpenAI Whisper API."""
     try:
-        from openai import OpenAI
-        
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = _get_openai_client()
         
         # Create a file-like object
         audio_file = io.BytesIO(audio_bytes)
         audio_file.name = filename
         
-        transcript = client.audio.transcriptions.create(
+        transcript = await client.audio.transcriptions.create(
             model="whisper-1",
             file=audio_file,
             language="es"  # Spanish language support
@@ -108,6 +326,8 @@ async def synthesize_audio_base64(text: str, voice_id: str | None = None) -> str
     """
     Synthesize speech and return as base64-encoded string.
     
+    The codec follows settings.tts_audio_format; tts_mime_type() gives the matching MIME type.
+    
     Args:
         text: Text to synthesize
         voice_id: Optional voice ID override
@@ -120,45 +340,39 @@ async def synthesize_audio_base64(text: str, voice_id: str | None = None) -> str
     
     # Check for mock mode
     if settings.use_mock_tts or settings.tts_provider == "mock":
-        mock_audio = generate_mock_audio_bytes()
-        return base64.b64encode(mock_audio).decode('utf-8')
+        return _cached_base64("mock", generate_mock_audio_bytes())
     
     try:
         if settings.tts_provider == "elevenlabs":
-            from elevenlabs import VoiceSettings
-            from elevenlabs.client import ElevenLabs
-            
-            client = ElevenLabs(api_key=settings.elevenlabs_api_key)
             voice = voice_id or settings.elevenlabs_voice_id
-            
-            audio_stream = client.text_to_speech.convert(
-                text=text,
-                voice_id=voice,
-                model_id=settings.elevenlabs_model,
-                voice_settings=VoiceSettings(
-                    stability=settings.elevenlabs_stability,
-                    similarity_boost=settings.elevenlabs_similarity_boost,
-                )
-            )
-            audio_bytes = b"".join(audio_stream)
+            key = _tts_cache_key("elevenlabs", settings.elevenlabs_model, voice, text)
+            audio_bytes = await _cached_synthesis(key, lambda: _elevenlabs_tts(text, voice))
             
         elif settings.tts_provider == "openai":
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=settings.openai_api_key)
-            response = client.audio.speech.create(
-                model="tts-1",
-                voice="alloy",
-                input=text
-            )
-            audio_bytes = response.content
+            key = _tts_cache_key("openai", "tts-1", "alloy", text)
+            audio_bytes = await _cached_synthesis(key, lambda: _openai_tts(text))
         else:
             return None
         
-        # Encode to base64
-        return base64.b64encode(audio_bytes).decode('utf-8')
+        # Encode to base64 (memoized per cache key)
+        return _cached_base64(key, audio_bytes)
         
     except Exception as e:
         # Log error but don't fail the request - return None if synthesis fails
         print(f"Audio synthesis failed: {str(e)}")
         return None
+
+
+async def synthesize_audio_base64_batch(texts: list[str], voice_id: str | None = None) -> list[str | None]:
+    """
+    Synthesize several texts concurrently and return them as base64-encoded strings.
+    
+    Args:
+        texts: Texts to synthesize
+        voice_id: Optional voice ID override
+        
+    Returns:
+        Base64-encoded audio data (or None) for each text, in the same order
+    """
+    # Providers have no batch endpoint: overlap the calls on the shared async client (bounded by the TTS semaphore)
+    return await asyncio.gather(*(synthesize_audio_base64(text, voice_id) for text in texts))
@@ -1,111 +1,257 @@
 """
 Fuzzy Logic Service for evaluating interview answers.
-Uses scikit-fuzzy to implement fuzzy inference system for scoring clarity, confidence, and relevance.
+Implements a Mamdani fuzzy inference system with triangular membership functions
+for scoring clarity, confidence, and relevance.
 """
+import hashlib
+import os
+import pathlib
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+from app.config import settings
 from app.models.schemas import NLPFeatures, EvaluationScore
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: inference runs as plain Python/NumPy
+    njit = None
+
+# Inputs are normalized to 0-10 and each lookup table is sampled at every integer point
+LUT_SIZE = 11
+
+# Triangular membership functions (a, b, c) for inputs on the 0-10 scale
+LOW = (0.0, 0.0, 4.0)
+MEDIUM = (3.0, 5.0, 7.0)
+HIGH = (6.0, 10.0, 10.0)
+
+# Filler ratio: low (good), medium, high (bad)
+FILLER_LOW = (0.0, 0.0, 3.0)
+FILLER_MEDIUM = (2.0, 5.0, 8.0)
+FILLER_HIGH = (7.0, 10.0, 10.0)
+
+# Output terms (0-10 scale), shared by clarity, confidence and relevance
+POOR = (0.0, 0.0, 3.0)
+FAIR = (2.0, 4.0, 6.0)
+GOOD = (5.0, 7.0, 9.0)
+EXCELLENT = (8.0, 10.0, 10.0)
+
+# Output universe sampled finely for centroid defuzzification
+OUTPUT_SAMPLES = 1001
+OUTPUT_UNIVERSE = np.linspace(0.0, 10.0, OUTPUT_SAMPLES)
+
+
+def _trimf(x: float, mf: tuple) -> float:
+    """
+    Triangular membership grade of x for the triangle mf = (a, b, c).
+
+    Shoulders (a == b or b == c) are handled by never dividing by a zero-width side.
+    """
+    a, b, c = mf
+    if x < a or x > c:
+        return 0.0
+    if x < b:
+        return (x - a) / (b - a)
+    if x > b:
+        return (c - x) / (c - b)
+    return 1.0
+
+
+def _centroid_loop(poor: float, fair: float, good: float, excellent: float) -> float:
+    """
+    Mamdani defuzzification: clip each output term at its activation, aggregate with max
+    and take the centroid over the sampled output universe.
+
+    Returns:
+        The crisp score, or 5.0 if no rule fires
+    """
+    step = 10.0 / (OUTPUT_SAMPLES - 1)
+    area = 0.0
+    moment = 0.0
+    for k in range(OUTPUT_SAMPLES):
+        x = k * step
+        mu = max(
+            min(poor, _trimf(x, POOR)),
+            min(fair, _trimf(x, FAIR)),
+            min(good, _trimf(x, GOOD)),
+            min(excellent, _trimf(x, EXCELLENT)),
+        )
+        area += mu
+        moment += mu * x
+    if area == 0.0:
+        # No rule fires for these inputs (edge case): default to middle score
+        return 5.0
+    return moment / area
+
+
+def _evaluate_fuzzy(
+    coherence: float,
+    filler_ratio: float,
+    confidence_level: float,
+    word_count: float,
+    technical_depth: float,
+    complexity: float
+) -> tuple[float, float, float]:
+    """
+    Run the clarity, confidence and relevance rule sets on normalized (0-10) inputs.
+
+    Returns:
+        (clarity, confidence, relevance) crisp scores
+    """
+    coh_low, coh_med, coh_high = _trimf(coherence, LOW), _trimf(coherence, MEDIUM), _trimf(coherence, HIGH)
+    fill_low, fill_med, fill_high = (
+        _trimf(filler_ratio, FILLER_LOW), _trimf(filler_ratio, FILLER_MEDIUM), _trimf(filler_ratio, FILLER_HIGH)
+    )
+    cl_low, cl_med, cl_high = (
+        _trimf(confidence_level, LOW), _trimf(confidence_level, MEDIUM), _trimf(confidence_level, HIGH)
+    )
+    wc_low, wc_med, wc_high = _trimf(word_count, LOW), _trimf(word_count, MEDIUM), _trimf(word_count, HIGH)
+    td_low, td_med, td_high = (
+        _trimf(technical_depth, LOW), _trimf(technical_depth, MEDIUM), _trimf(technical_depth, HIGH)
+    )
+    cx_low, cx_med, cx_high = _trimf(complexity, LOW), _trimf(complexity, MEDIUM), _trimf(complexity, HIGH)
+
+    # Clarity rules (based on coherence, filler words, and structure)
+    clarity = _centroid(
+        max(coh_low, fill_high),
+        min(coh_med, fill_med),
+        max(min(coh_high, fill_med), min(coh_med, fill_low)),
+        min(coh_high, fill_low)
+    )
+
+    # Confidence rules (based on confidence indicators and word count)
+    confidence = _centroid(
+        cl_low,
+        min(cl_med, wc_low),
+        max(min(cl_high, wc_med), min(cl_med, wc_med)),
+        min(cl_high, wc_high)
+    )
+
+    # Relevance rules (based on technical depth and complexity)
+    relevance = _centroid(
+        td_low,
+        min(td_med, cx_low),
+        max(min(td_high, cx_med), min(td_med, cx_med)),
+        min(td_high, cx_high)
+    )
+
+    return clarity, confidence, relevance
+
+
+if njit is not None:
+    _trimf = njit(cache=True, fastmath=True)(_trimf)
+    _centroid = njit(cache=True, fastmath=True)(_centroid_loop)
+    _evaluate_fuzzy = njit(cache=True, fastmath=True)(_evaluate_fuzzy)
+else:
+    # Without numba, vectorize the centroid over precomputed output grades instead of looping in Python
+    _OUTPUT_GRADES = np.array([[_trimf(x, mf) for x in OUTPUT_UNIVERSE] for mf in (POOR, FAIR, GOOD, EXCELLENT)])
+
+    def _centroid(poor: float, fair: float, good: float, excellent: float) -> float:
+        """NumPy equivalent of _centroid_loop."""
+        activations = np.array([poor, fair, good, excellent])[:, None]
+        aggregated = np.minimum(activations, _OUTPUT_GRADES).max(axis=0)
+        area = aggregated.sum()
+        if area == 0:
+            # No rule fires for these inputs (edge case): default to middle score
+            return 5.0
+        return float((aggregated * OUTPUT_UNIVERSE).sum() / area)
+
+
+def _clip(value: float) -> float:
+    """Clip a normalized input into the 0-10 fuzzy universe."""
+    return float(min(max(value, 0.0), 10.0))
+
+
+def _bilinear(lut: np.ndarray, x: float, y: float) -> float:
+    """Bilinearly interpolate a 2D lookup table at (x, y) in table coordinates."""
+    i = min(int(np.floor(x)), lut.shape[0] - 2)
+    j = min(int(np.floor(y)), lut.shape[1] - 2)
+    fx, fy = x - i, y - j
+    top = lut[i, j] * (1 - fx) + lut[i + 1, j] * fx
+    bottom = lut[i, j + 1] * (1 - fx) + lut[i + 1, j + 1] * fx
+    return float(top * (1 - fy) + bottom * fy)
+
+
+def _bilinear_batch(lut: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Bilinearly interpolate a 2D lookup table at many (x, y) points at once."""
+    i = np.minimum(np.floor(x).astype(np.intp), lut.shape[0] - 2)
+    j = np.minimum(np.floor(y).astype(np.intp), lut.shape[1] - 2)
+    fx, fy = x - i, y - j
+    top = lut[i, j] * (1 - fx) + lut[i + 1, j] * fx
+    bottom = lut[i, j + 1] * (1 - fx) + lut[i + 1, j + 1] * fx
+    return top * (1 - fy) + bottom * fy
+
 
 class FuzzyEvaluationService:
     """Service for evaluating answers using fuzzy logic."""
 
-    def __init__(self):
-        """Initialize fuzzy inference system."""
-        self._setup_fuzzy_system()
-
-    def _setup_fuzzy_system(self):
-        """Set up the fuzzy inference system with rules."""
-
-        # Define fuzzy variables for inputs (0-10 scale after normalization)
-        self.word_count = ctrl.Antecedent(np.arange(0, 11, 1), 'word_count')
-        self.coherence = ctrl.Antecedent(np.arange(0, 11, 1), 'coherence')
-        self.confidence_level = ctrl.Antecedent(np.arange(0, 11, 1), 'confidence_level')
-        self.technical_depth = ctrl.Antecedent(np.arange(0, 11, 1), 'technical_depth')
-        self.filler_ratio = ctrl.Antecedent(np.arange(0, 11, 1), 'filler_ratio')  # Inverse: lower is better
-        self.complexity = ctrl.Antecedent(np.arange(0, 11, 1), 'complexity')
-
-        # Define fuzzy variables for outputs (0-10 scale)
-        self.clarity_score = ctrl.Consequent(np.arange(0, 11, 1), 'clarity_score')
-        self.confidence_score = ctrl.Consequent(np.arange(0, 11, 1), 'confidence_score')
-        self.relevance_score = ctrl.Consequent(np.arange(0, 11, 1), 'relevance_score')
-
-        # Define membership functions for inputs
-        # Word count: low, medium, high
-        self.word_count['low'] = fuzz.trimf(self.word_count.universe, [0, 0, 4])
-        self.word_count['medium'] = fuzz.trimf(self.word_count.universe, [3, 5, 7])
-        self.word_count['high'] = fuzz.trimf(self.word_count.universe, [6, 10, 10])
-
-        # Coherence: low, medium, high
-        self.coherence['low'] = fuzz.trimf(self.coherence.universe, [0, 0, 4])
-        self.coherence['medium'] = fuzz.trimf(self.coherence.universe, [3, 5, 7])
-        self.coherence['high'] = fuzz.trimf(self.coherence.universe, [6, 10, 10])
-
-        # Confidence level: low, medium, high
-        self.confidence_level['low'] = fuzz.trimf(self.confidence_level.universe, [0, 0, 4])
-        self.confidence_level['medium'] = fuzz.trimf(self.confidence_level.universe, [3, 5, 7])
-        self.confidence_level['high'] = fuzz.trimf(self.confidence_level.universe, [6, 10, 10])
-
-        # Technical depth: low, medium, high
-        self.technical_depth['low'] = fuzz.trimf(self.technical_depth.universe, [0, 0, 4])
-        self.technical_depth['medium'] = fuzz.trimf(self.technical_depth.universe, [3, 5, 7])
-        self.technical_depth['high'] = fuzz.trimf(self.technical_depth.universe, [6, 10, 10])
-
-        # Filler ratio: low (good), medium, high (bad)
-        self.filler_ratio['low'] = fuzz.trimf(self.filler_ratio.universe, [0, 0, 3])
-        self.filler_ratio['medium'] = fuzz.trimf(self.filler_ratio.universe, [2, 5, 8])
-        self.filler_ratio['high'] = fuzz.trimf(self.filler_ratio.universe, [7, 10, 10])
-
-        # Complexity: low, medium, high
-        self.complexity['low'] = fuzz.trimf(self.complexity.universe, [0, 0, 4])
-        self.complexity['medium'] = fuzz.trimf(self.complexity.universe, [3, 5, 7])
-        self.complexity['high'] = fuzz.trimf(self.complexity.universe, [6, 10, 10])
-
-        # Define membership functions for outputs
-        for output in [self.clarity_score, self.confidence_score, self.relevance_score]:
-            output['poor'] = fuzz.trimf(output.universe, [0, 0, 3])
-            output['fair'] = fuzz.trimf(output.universe, [2, 4, 6])
-            output['good'] = fuzz.trimf(output.universe, [5, 7, 9])
-            output['excellent'] = fuzz.trimf(output.universe, [8, 10, 10])
-
-        # Define fuzzy rules
-        self._define_rules()
-
-    def _define_rules(self):
-        """Define fuzzy inference rules."""
-
-        # Clarity rules (based on coherence, filler words, and structure)
-        clarity_rules = [
-            ctrl.Rule(self.coherence['high'] & self.filler_ratio['low'], self.clarity_score['excellent']),
-            ctrl.Rule(self.coherence['high'] & self.filler_ratio['medium'], self.clarity_score['good']),
-            ctrl.Rule(self.coherence['medium'] & self.filler_ratio['low'], self.clarity_score['good']),
-            ctrl.Rule(self.coherence['medium'] & self.filler_ratio['medium'], self.clarity_score['fair']),
-            ctrl.Rule(self.coherence['low'] | self.filler_ratio['high'], self.clarity_score['poor']),
-        ]
+    # Stacked (clarity, confidence, relevance) lookup tables, shared by every instance in the process
+    _luts: np.ndarray | None = None
 
-        # Confidence rules (based on confidence indicators and word count)
-        confidence_rules = [
-            ctrl.Rule(self.confidence_level['high'] & self.word_count['high'], self.confidence_score['excellent']),
-            ctrl.Rule(self.confidence_level['high'] & self.word_count['medium'], self.confidence_score['good']),
-            ctrl.Rule(self.confidence_level['medium'] & self.word_count['medium'], self.confidence_score['good']),
-            ctrl.Rule(self.confidence_level['medium'] & self.word_count['low'], self.confidence_score['fair']),
-            ctrl.Rule(self.confidence_level['low'], self.confidence_score['poor']),
-        ]
+    def __init__(self, use_lut: bool = False):
+        """
+        Initialize fuzzy inference system.
 
-        # Relevance rules (based on technical depth and complexity)
-        relevance_rules = [
-            ctrl.Rule(self.technical_depth['high'] & self.complexity['high'], self.relevance_score['excellent']),
-            ctrl.Rule(self.technical_depth['high'] & self.complexity['medium'], self.relevance_score['good']),
-            ctrl.Rule(self.technical_depth['medium'] & self.complexity['medium'], self.relevance_score['good']),
-            ctrl.Rule(self.technical_depth['medium'] & self.complexity['low'], self.relevance_score['fair']),
-            ctrl.Rule(self.technical_depth['low'], self.relevance_score['poor']),
-        ]
+        Args:
+            use_lut: Score from precomputed lookup tables instead of running the inference per answer
+                (faster, but interpolated scores can differ from exact inference by several points)
+        """
+        self.use_lut = use_lut
+        if self.use_lut:
+            luts = self._build_or_load_luts()
+            self._clarity_lut, self._confidence_lut, self._relevance_lut = luts
 
-        # Create control systems
-        self.clarity_system = ctrl.ControlSystem(clarity_rules)
-        self.confidence_system = ctrl.ControlSystem(confidence_rules)
-        self.relevance_system = ctrl.ControlSystem(relevance_rules)
+    @classmethod
+    def _build_or_load_luts(cls) -> np.ndarray:
+        """
+        Get the lookup tables, memory-mapping them from the on-disk cache when possible.
+
+        Workers that start after the first one map the same read-only pages instead of recomputing.
+
+        Returns:
+            Array of shape (3, LUT_SIZE, LUT_SIZE) with the clarity, confidence and relevance tables
+        """
+        if cls._luts is not None:
+            return cls._luts
+
+        path = cls._lut_cache_path()
+        if path is not None and path.exists():
+            try:
+                cls._luts = np.load(path, mmap_mode='r')
+                return cls._luts
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable fuzzy lookup table cache: {str(e)}")
+
+        cls._luts = cls._build_luts()
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write then rename so concurrently starting workers never read a partial file
+                tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+                np.save(tmp_path, cls._luts)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Could not cache fuzzy lookup tables: {str(e)}")
+        return cls._luts
+
+    @staticmethod
+    def _lut_cache_path() -> pathlib.Path | None:
+        """Get the lookup table cache file, versioned by every constant that shapes the tables."""
+        if not settings.fuzzy_lut_cache_dir:
+            return None
+        version = hashlib.sha1(repr((
+            LUT_SIZE, OUTPUT_SAMPLES, LOW, MEDIUM, HIGH, FILLER_LOW, FILLER_MEDIUM, FILLER_HIGH,
+            POOR, FAIR, GOOD, EXCELLENT
+        )).encode("utf-8")).hexdigest()[:12]
+        return pathlib.Path(settings.fuzzy_lut_cache_dir).expanduser() / f"fuzzy_luts_{version}.npy"
+
+    @staticmethod
+    def _build_luts() -> np.ndarray:
+        """Precompute each score's response surface on the integer grid of its 0-10 inputs."""
+        luts = np.empty((3, LUT_SIZE, LUT_SIZE), dtype=np.float32)
+        for i in range(LUT_SIZE):
+            for j in range(LUT_SIZE):
+                # Each rule set reads its own input pair, so one call fills all three tables
+                luts[:, i, j] = _evaluate_fuzzy(float(i), float(j), float(i), float(j), float(i), float(j))
+        return luts
 
     def evaluate(self, features: NLPFeatures, answer_text: str) -> EvaluationScore:
         """
@@ -121,49 +267,64 @@ class FuzzyEvaluationService:
         # Normalize features to 0-10 scale
         normalized = self._normalize_features(features)
 
-        # Calculate clarity score
-        clarity_sim = ctrl.ControlSystemSimulation(self.clarity_system)
-        clarity_sim.input['coherence'] = normalized['coherence']
-        clarity_sim.input['filler_ratio'] = normalized['filler_ratio']
-        try:
-            clarity_sim.compute()
-            clarity = float(clarity_sim.output['clarity_score'])
-        except (KeyError, AssertionError):
-            # Fallback if fuzzy inference fails (edge case inputs)
-            clarity = 5.0  # Default to middle score
-
-        # Calculate confidence score
-        confidence_sim = ctrl.ControlSystemSimulation(self.confidence_system)
-        confidence_sim.input['confidence_level'] = normalized['confidence_level']
-        confidence_sim.input['word_count'] = normalized['word_count']
-        try:
-            confidence_sim.compute()
-            confidence = float(confidence_sim.output['confidence_score'])
-        except (KeyError, AssertionError):
-            # Fallback if fuzzy inference fails (edge case inputs)
-            confidence = 5.0  # Default to middle score
-
-        # Calculate relevance score
-        relevance_sim = ctrl.ControlSystemSimulation(self.relevance_system)
-        relevance_sim.input['technical_depth'] = normalized['technical_depth']
-        relevance_sim.input['complexity'] = normalized['complexity']
-        try:
-            relevance_sim.compute()
-            relevance = float(relevance_sim.output['relevance_score'])
-        except (KeyError, AssertionError):
-            # Fallback if fuzzy inference fails (edge case inputs)
-            relevance = 5.0  # Default to middle score
+        if self.use_lut:
+            # Interpolate each score from its precomputed response surface
+            clarity = _bilinear(self._clarity_lut, normalized['coherence'], normalized['filler_ratio'])
+            confidence = _bilinear(self._confidence_lut, normalized['confidence_level'], normalized['word_count'])
+            relevance = _bilinear(self._relevance_lut, normalized['technical_depth'], normalized['complexity'])
+        else:
+            clarity, confidence, relevance = _evaluate_fuzzy(
+                normalized['coherence'],
+                normalized['filler_ratio'],
+                normalized['confidence_level'],
+                normalized['word_count'],
+                normalized['technical_depth'],
+                normalized['complexity']
+            )
 
         # Calculate overall score (weighted average)
         overall = (clarity * 0.3) + (confidence * 0.3) + (relevance * 0.4)
 
-        return EvaluationScore(
-            clarity=round(clarity, 2),
-            confidence=round(confidence, 2),
-            relevance=round(relevance, 2),
-            overall_score=round(overall, 2)
+        # Scores are in [0, 10] by construction: skip the range validators
+        return EvaluationScore.model_construct(
+            clarity=round(float(clarity), 2),
+            confidence=round(float(confidence), 2),
+            relevance=round(float(relevance), 2),
+            overall_score=round(float(overall), 2)
         )
 
+    def evaluate_batch(self, features_list: list[NLPFeatures]) -> list[EvaluationScore]:
+        """
+        Evaluate several answers at once with vectorized lookups.
+
+        Args:
+            features_list: Extracted NLP features, one per answer
+
+        Returns:
+            EvaluationScore for each answer, in the same order
+        """
+        if not features_list:
+            return []
+        if not self.use_lut:
+            return [self.evaluate(features, "") for features in features_list]
+
+        normalized = self._normalize_features_batch(features_list)
+
+        clarity = _bilinear_batch(self._clarity_lut, normalized['coherence'], normalized['filler_ratio'])
+        confidence = _bilinear_batch(self._confidence_lut, normalized['confidence_level'], normalized['word_count'])
+        relevance = _bilinear_batch(self._relevance_lut, normalized['technical_depth'], normalized['complexity'])
+        overall = (clarity * 0.3) + (confidence * 0.3) + (relevance * 0.4)
+
+        return [
+            EvaluationScore.model_construct(
+                clarity=round(c, 2),
+                confidence=round(cf, 2),
+                relevance=round(r, 2),
+                overall_score=round(o, 2)
+            )
+            for c, cf, r, o in zip(clarity.tolist(), confidence.tolist(), relevance.tolist(), overall.tolist())
+        ]
+
     def _normalize_features(self, features: NLPFeatures) -> dict:
         """
         Normalize NLP features to 0-10 scale for fuzzy input.
@@ -175,35 +336,59 @@ class FuzzyEvaluationService:
             Dictionary of normalized values
         """
         # Word count: normalize based on expected ranges (50-200 words)
-        word_count_norm = min((features.word_count / 150) * 10, 10)
+        word_count_norm = (features.word_count / 150) * 10
 
         # Coherence: already 0-1, scale to 0-10
         coherence_norm = features.coherence_score * 10
 
         # Confidence level: based on confidence indicators per 100 words
         confidence_ratio = (features.confidence_indicators / max(features.word_count / 100, 1))
-        confidence_norm = min(confidence_ratio * 5, 10)  # Scale appropriately
+        confidence_norm = confidence_ratio * 5  # Scale appropriately
 
         # Technical depth: based on technical terms per 100 words
         technical_ratio = (features.technical_terms_count / max(features.word_count / 100, 1))
-        technical_norm = min(technical_ratio * 3, 10)  # Scale appropriately
+        technical_norm = technical_ratio * 3  # Scale appropriately
 
         # Filler ratio: inverse - more fillers = worse score
         filler_ratio = (features.filler_words_count / max(features.word_count / 100, 1))
-        filler_norm = max(10 - (filler_ratio * 5), 0)  # Inverse scale
+        filler_norm = 10 - (filler_ratio * 5)  # Inverse scale
 
         # Complexity: already 0-1, scale to 0-10
         complexity_norm = features.complexity_score * 10
 
+        # Clip once into the fuzzy universe; every input in [0, 10] yields a score, so no fallback is needed
         return {
-            'word_count': max(0, min(word_count_norm, 10)),
-            'coherence': max(0, min(coherence_norm, 10)),
-            'confidence_level': max(0, min(confidence_norm, 10)),
-            'technical_depth': max(0, min(technical_norm, 10)),
-            'filler_ratio': max(0, min(filler_norm, 10)),
-            'complexity': max(0, min(complexity_norm, 10)),
+            'word_count': _clip(word_count_norm),
+            'coherence': _clip(coherence_norm),
+            'confidence_level': _clip(confidence_norm),
+            'technical_depth': _clip(technical_norm),
+            'filler_ratio': _clip(filler_norm),
+            'complexity': _clip(complexity_norm),
+        }
+
+    def _normalize_features_batch(self, features_list: list[NLPFeatures]) -> dict[str, np.ndarray]:
+        """
+        Normalize many NLP feature sets to the 0-10 fuzzy input scale at once.
+
+        Args:
+            features_list: NLPFeatures objects
+
+        Returns:
+            Dictionary of normalized value arrays, same scaling as _normalize_features
+        """
+        word_count = np.array([f.word_count for f in features_list], dtype=np.float64)
+        per_100_words = np.maximum(word_count / 100, 1)
+
+        normalized = {
+            'word_count': (word_count / 150) * 10,
+            'coherence': np.array([f.coherence_score for f in features_list], dtype=np.float64) * 10,
+            'confidence_level': np.array([f.confidence_indicators for f in features_list], dtype=np.float64) / per_100_words * 5,
+            'technical_depth': np.array([f.technical_terms_count for f in features_list], dtype=np.float64) / per_100_words * 3,
+            'filler_ratio': 10 - np.array([f.filler_words_count for f in features_list], dtype=np.float64) / per_100_words * 5,
+            'complexity': np.array([f.complexity_score for f in features_list], dtype=np.float64) * 10,
         }
+        return {name: np.clip(values, 0, 10) for name, values in normalized.items()}
 
 
 # Singleton instance
-fuzzy_service = FuzzyEvaluationService()
+fuzzy_service = FuzzyEvaluationService(use_lut=settings.fuzzy_use_lut)
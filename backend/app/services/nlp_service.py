@@ -2,10 +2,245 @@
 NLP Service for extracting linguistic features from interview answers.
 Uses spaCy for text analysis and basic sentiment/complexity metrics.
 """
+import os
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
+import numpy as np
+from app.config import settings
 from app.models.schemas import NLPFeatures
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: the kernels below run as plain Python
+    njit = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional: vocabulary counting falls back to substring checks
+    ahocorasick = None
+
+try:
+    from spacy.attrs import IS_PUNCT, IS_SPACE, LEMMA, LENGTH, LOWER, POS, SENT_START
+    from spacy.symbols import NOUN, PROPN, VERB
+except ImportError:  # Reported with an install hint when the model is first loaded
+    IS_PUNCT = IS_SPACE = LEMMA = LENGTH = LOWER = POS = SENT_START = None
+    NOUN = PROPN = VERB = 0
+
+# Token attributes exported per doc as one array (column order matters)
+TOKEN_ATTRS = [LEMMA, POS, IS_PUNCT, IS_SPACE, LOWER, LENGTH, SENT_START]
+LEMMA_COL, POS_COL, IS_PUNCT_COL, IS_SPACE_COL, LOWER_COL, LENGTH_COL, SENT_START_COL = range(7)
+
+# Parts of speech treated as sentence keywords for coherence
+KEYWORD_POS = np.array([NOUN, PROPN, VERB], dtype=np.uint64)
+
+# Pipeline components extract_features never reads (entities are unused)
+DISABLED_PIPES = ["ner"]
+
+
+def _lexicon(words: set[str]) -> frozenset[str]:
+    """Freeze a vocabulary, interning its words so every lookup shares the same string objects."""
+    return frozenset(sys.intern(word) for word in words)
+
+
+# Vocabularies shared by every NLPService instance
+FILLER_WORDS = _lexicon({
+    "eh", "este", "o sea", "digamos", "bueno", "tipo", "sabes",
+    "entonces", "mhm", "pues", "básicamente", "literalmente", "así que", "umm", "uh"
+})
+CONFIDENCE_INDICATORS = _lexicon({
+    "definitivamente", "ciertamente", "claramente", "obviamente",
+    "precisamente", "exactamente", "absolutamente", "seguro",
+    "indudablemente", "sin duda", "creo", "pienso", "sé", "confío", "experiencia"
+})
+# Common technical terms (English terms are common in tech, added Spanish variations)
+TECHNICAL_TERMS = _lexicon({
+    "algorithm", "complexity", "database", "api", "framework",
+    "architecture", "scalability", "optimization", "implementation",
+    "design pattern", "microservice", "cache", "queue", "stack",
+    "performance", "latency", "throughput", "distributed", "concurrent",
+    "algoritmo", "complejidad", "base de datos", "arquitectura",
+    "escalabilidad", "optimización", "implementación", "patrón de diseño",
+    "microservicio", "cola", "pila", "rendimiento", "latencia",
+    "concurrente", "distribuido"
+})
+# Sentiment word lists (simple approach; for production, consider using transformers)
+POSITIVE_WORDS = _lexicon({
+    "bien", "excelente", "gran", "positivo", "éxito", "lograr",
+    "mejorar", "efectivo", "eficiente", "fuerte", "confiado", "capaz",
+    "bueno", "genial", "increíble", "solución", "resolver"
+})
+NEGATIVE_WORDS = _lexicon({
+    "mal", "pobre", "fallar", "difícil", "problema", "asunto", "lucha",
+    "débil", "incapaz", "no puedo", "nunca", "imposible", "confundido",
+    "error", "malo", "complicado"
+})
+
+# Column order of the per-answer vocabulary count vectors used for batch sentiment
+VOCABULARY_CATEGORIES = ("filler", "confidence", "technical", "positive", "negative")
+POSITIVE_COUNT_COL = VOCABULARY_CATEGORIES.index("positive")
+NEGATIVE_COUNT_COL = VOCABULARY_CATEGORIES.index("negative")
+
+# Answers with fewer (whitespace-separated) words than this are analyzed without spaCy
+SHORT_ANSWER_WORDS = 15
+WORD_PATTERN = re.compile(r"\w+")
+SENTENCE_END_PATTERN = re.compile(r"[.!?…]+")
+
+# Answers up to this many characters skip the dependency parser and get sentence boundaries from senter
+LIGHT_PIPELINE_MAX_CHARS = 300
+
+# Two-sentence answer run through each pipeline at preload to prime spaCy's caches and compile the kernels
+WARMUP_TEXT = (
+    "Diseñé una arquitectura de microservicios para mejorar la escalabilidad del sistema. "
+    "Con esa arquitectura redujimos la latencia y el equipo pudo desplegar cada servicio de forma independiente."
+)
+
+# Answers are truncated to this many characters to bound the cost of pathological inputs
+MAX_TEXT_CHARS = 5000
+
+
+def _jaccard_chain(offsets: np.ndarray, ids: np.ndarray) -> float:
+    """
+    Average Jaccard overlap of keyword sets between consecutive sentences.
+
+    Args:
+        offsets: Start of each sentence's keywords in ids, plus the end of the last one
+        ids: Integer keyword ids, sorted and deduplicated within each sentence
+
+    Returns:
+        Mean overlap over consecutive sentence pairs that both have keywords, or 0.5 if none do
+    """
+    total = 0.0
+    pairs = 0
+    for s in range(offsets.shape[0] - 2):
+        a_start, a_end = offsets[s], offsets[s + 1]
+        b_start, b_end = offsets[s + 1], offsets[s + 2]
+        if a_end > a_start and b_end > b_start:
+            # Two-pointer merge of the sorted keyword ids
+            i, j = a_start, b_start
+            shared = 0
+            while i < a_end and j < b_end:
+                if ids[i] == ids[j]:
+                    shared += 1
+                    i += 1
+                    j += 1
+                elif ids[i] < ids[j]:
+                    i += 1
+                else:
+                    j += 1
+            total += shared / ((a_end - a_start) + (b_end - b_start) - shared)
+            pairs += 1
+
+    return total / pairs if pairs > 0 else 0.5
+
+
+def _complexity_kernel(lemma_ids: np.ndarray, token_lengths: np.ndarray) -> float:
+    """
+    Combine vocabulary diversity and average word length into a 0-1 score.
+
+    Args:
+        lemma_ids: Hashed lemma of each word
+        token_lengths: Character length of each word
+
+    Returns:
+        Complexity score from 0 to 1
+    """
+    n_words = lemma_ids.shape[0]
+    if n_words == 0:
+        return 0.0
+
+    # Vocabulary diversity (unique words / total words)
+    diversity = np.unique(lemma_ids).shape[0] / n_words
+
+    # Average word length, normalized to 0-1 (assuming avg word length of 5 is medium, 10 is complex)
+    avg_word_length = token_lengths.sum() / n_words
+    length_score = min(avg_word_length / 10, 1.0)
+
+    return (diversity * 0.6) + (length_score * 0.4)
+
+
+def _bitmap_jaccard_chain(keyword_sents: np.ndarray, ids: np.ndarray, sentence_count: int) -> float:
+    """
+    Average Jaccard overlap between consecutive sentences, with each keyword set held as an int bitmap.
+
+    Args:
+        keyword_sents: Sentence index of each keyword
+        ids: Integer keyword id of each keyword (repeats allowed, any order)
+        sentence_count: Number of sentences in the document
+
+    Returns:
+        Mean overlap over consecutive sentence pairs that both have keywords, or 0.5 if none do
+    """
+    bitmaps = [0] * sentence_count
+    for sent, keyword_id in zip(keyword_sents.tolist(), ids.tolist()):
+        bitmaps[sent] |= 1 << keyword_id
+
+    total = 0.0
+    pairs = 0
+    for current, following in zip(bitmaps, bitmaps[1:]):
+        if current and following:
+            total += (current & following).bit_count() / (current | following).bit_count()
+            pairs += 1
+
+    return total / pairs if pairs > 0 else 0.5
+
+
+def _is_short_answer(text: str) -> bool:
+    """Check whether an answer is short enough for the spaCy-free fast path."""
+    return len(text.split()) < SHORT_ANSWER_WORDS
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Check whether text has a word character (as regex \\w) at index; out-of-range positions are boundaries."""
+    if index < 0 or index >= len(text):
+        return False
+    char = text[index]
+    return char.isalnum() or char == "_"
+
+
+if njit is not None:
+    _jaccard_chain = njit(cache=True)(_jaccard_chain)
+    _complexity_kernel = njit(cache=True)(_complexity_kernel)
+
+
+class _LightPipeline:
+    """
+    Parser-free view of a loaded spaCy pipeline: sentence boundaries come from its (disabled) senter.
+
+    Runs the pipeline's own component objects, so it adds no memory over the main pipeline.
+    """
+
+    def __init__(self, nlp):
+        """
+        Initialize the view.
+
+        Args:
+            nlp: Loaded spaCy pipeline that includes a senter component
+        """
+        self.make_doc = nlp.make_doc
+        self.components = [nlp.get_pipe("senter")] + [
+            component for name, component in nlp.pipeline if name != "parser"
+        ]
+
+    def __call__(self, text: str):
+        """Process one text."""
+        doc = self.make_doc(text)
+        for component in self.components:
+            doc = component(doc)
+        return doc
+
+    def pipe(self, texts, batch_size: int = 64, n_process: int = 1):
+        """Process a stream of texts, batching inside each component (n_process is accepted for parity and ignored)."""
+        docs = (self.make_doc(text) for text in texts)
+        for component in self.components:
+            if hasattr(component, "pipe"):
+                docs = component.pipe(docs, batch_size=batch_size)
+            else:
+                docs = map(component, docs)
+        return docs
+
 
 class NLPService:
     """Service for analyzing text and extracting linguistic features."""
@@ -13,44 +248,108 @@ class NLPService:
     def __init__(self):
         """Initialize the NLP service. Lazy-loads spaCy model when needed."""
         self._nlp = None
-        self.filler_words = {
-            "eh", "este", "o sea", "digamos", "bueno", "tipo", "sabes",
-            "entonces", "mhm", "pues", "básicamente", "literalmente", "así que", "umm", "uh"
+        self._nlp_light = None
+        # Extraction runs on nlp_executor threads; make sure the model is loaded only once
+        # (reentrant: building the light pipeline loads the main one)
+        self._load_lock = threading.RLock()
+        self.filler_words = FILLER_WORDS
+        self.confidence_indicators = CONFIDENCE_INDICATORS
+        self.technical_terms = TECHNICAL_TERMS
+        self.positive_words = POSITIVE_WORDS
+        self.negative_words = NEGATIVE_WORDS
+        self._vocabularies = {
+            "filler": self.filler_words,
+            "confidence": self.confidence_indicators,
+            "technical": self.technical_terms,
+            "positive": self.positive_words,
+            "negative": self.negative_words,
         }
-        self.confidence_indicators = {
-            "definitivamente", "ciertamente", "claramente", "obviamente",
-            "precisamente", "exactamente", "absolutamente", "seguro",
-            "indudablemente", "sin duda", "creo", "pienso", "sé", "confío", "experiencia"
+        # Single words are matched against the answer's tokens; only multi-word phrases need a text scan
+        self._single_words = {
+            category: frozenset(word for word in words if " " not in word)
+            for category, words in self._vocabularies.items()
         }
-        # Common technical terms (English terms are common in tech, added Spanish variations)
-        self.technical_terms = {
-            "algorithm", "complexity", "database", "api", "framework",
-            "architecture", "scalability", "optimization", "implementation",
-            "design pattern", "microservice", "cache", "queue", "stack",
-            "performance", "latency", "throughput", "distributed", "concurrent",
-            "algoritmo", "complejidad", "base de datos", "arquitectura",
-            "escalabilidad", "optimización", "implementación", "patrón de diseño",
-            "microservicio", "cola", "pila", "rendimiento", "latencia",
-            "concurrente", "distribuido"
+        self._phrases = {
+            category: tuple(word for word in words if " " in word)
+            for category, words in self._vocabularies.items()
         }
+        # A phrase may belong to several vocabularies
+        self._phrase_categories: dict[str, tuple[str, ...]] = {}
+        for category, phrases in self._phrases.items():
+            for phrase in phrases:
+                self._phrase_categories[phrase] = self._phrase_categories.get(phrase, ()) + (category,)
+        self._automaton = self._build_automaton()
+        self._phrase_regex = self._build_phrase_regex()
+
+    def _build_automaton(self):
+        """
+        Compile every multi-word phrase into one Aho-Corasick automaton.
+
+        Returns:
+            The automaton, or None if pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for phrase, categories in self._phrase_categories.items():
+            automaton.add_word(phrase, (phrase, categories))
+        automaton.make_automaton()
+        return automaton
+
+    def _build_phrase_regex(self) -> re.Pattern:
+        """Compile every multi-word phrase into one word-bounded alternation (used without pyahocorasick)."""
+        # Longest phrases first so an alternative is never shadowed by a shorter prefix of it
+        phrases = sorted(self._phrase_categories, key=len, reverse=True)
+        return re.compile(r"\b(" + "|".join(map(re.escape, phrases)) + r")\b")
 
     @property
     def nlp(self):
         """Lazy-load spaCy model."""
         if self._nlp is None:
-            try:
-                import spacy
-                # Try to load Spanish model, fallback to blank if not available
-                try:
-                    self._nlp = spacy.load("es_core_news_sm")
-                except OSError:
-                    print("Warning: spaCy model 'es_core_news_sm' not found. Using blank model.")
-                    print("Install with: python -m spacy download es_core_news_sm")
-                    self._nlp = spacy.blank("es")
-            except ImportError:
-                raise ImportError("spaCy is not installed. Install with: pip install spacy")
+            with self._load_lock:
+                if self._nlp is None:
+                    try:
+                        import spacy
+                        # Try to load Spanish model, fallback to blank if not available
+                        try:
+                            self._nlp = spacy.load("es_core_news_sm", disable=DISABLED_PIPES)
+                        except OSError:
+                            print("Warning: spaCy model 'es_core_news_sm' not found. Using blank model.")
+                            print("Install with: python -m spacy download es_core_news_sm")
+                            self._nlp = spacy.blank("es")
+                    except ImportError:
+                        raise ImportError("spaCy is not installed. Install with: pip install spacy")
         return self._nlp
 
+    @property
+    def nlp_light(self):
+        """Lazy-load the parser-free pipeline (sentences from senter) used for short answers."""
+        if self._nlp_light is None:
+            with self._load_lock:
+                if self._nlp_light is None:
+                    if "senter" in self.nlp.component_names:
+                        # Reuse the loaded components (no second copy of the weights), with senter instead of the parser
+                        self._nlp_light = _LightPipeline(self.nlp)
+                    else:
+                        # Blank fallback model has no senter: share the main pipeline
+                        self._nlp_light = self.nlp
+        return self._nlp_light
+
+    def preload(self) -> None:
+        """
+        Load and warm up the spaCy pipelines now, e.g. in the parent process before workers are forked.
+
+        A warm-up answer is analyzed by each pipeline, so model loading, first-call cache setup and
+        kernel compilation happen here rather than on the first user's answer.
+        """
+        for nlp in (self.nlp_light, self.nlp):
+            self._features_from_doc(WARMUP_TEXT, nlp(WARMUP_TEXT))
+
+    def _pipeline_for(self, text: str):
+        """Pick the spaCy pipeline for a (truncated) answer."""
+        return self.nlp_light if len(text) <= LIGHT_PIPELINE_MAX_CHARS else self.nlp
+
     def extract_features(self, text: str) -> NLPFeatures:
         """
         Extract comprehensive NLP features from text.
@@ -62,119 +361,261 @@ class NLPService:
             NLPFeatures object containing all extracted features
         """
         if not text or not text.strip():
-            return NLPFeatures()
+            return NLPFeatures.model_construct()
 
-        text_lower = text.lower()
-        doc = self.nlp(text)
+        text = text[:MAX_TEXT_CHARS]
+        if _is_short_answer(text):
+            return self._features_from_words(text)
+        return self._features_from_doc(text, self._pipeline_for(text)(text))
 
-        # Basic text statistics
-        words = [token for token in doc if not token.is_punct and not token.is_space]
+    def extract_features_batch(self, texts: list[str]) -> list[NLPFeatures]:
+        """
+        Extract NLP features from several texts, running them through spaCy as one stream.
+
+        Args:
+            texts: The answer texts to analyze
+
+        Returns:
+            NLPFeatures for each text, in the same order
+        """
+        texts = [(text or "")[:MAX_TEXT_CHARS] for text in texts]
+        non_empty = [i for i, text in enumerate(texts) if text.strip()]
+
+        # Each builder fills its answer's row of vocabulary counts; sentiment is computed for all rows at once below
+        counts = np.zeros((len(texts), len(VOCABULARY_CATEGORIES)), dtype=np.int32)
+        features = [NLPFeatures.model_construct() for _ in texts]
+        for i in non_empty:
+            if _is_short_answer(texts[i]):
+                features[i] = self._features_from_words(texts[i], counts[i])
+        non_empty = [i for i in non_empty if not _is_short_answer(texts[i])]
+
+        short = [i for i in non_empty if len(texts[i]) <= LIGHT_PIPELINE_MAX_CHARS]
+        long = [i for i in non_empty if len(texts[i]) > LIGHT_PIPELINE_MAX_CHARS]
+
+        for nlp, indices in ((self.nlp_light, short), (self.nlp, long)):
+            if not indices:
+                continue
+            docs = nlp.pipe((texts[i] for i in indices), batch_size=settings.nlp_spacy_batch_size, n_process=1)
+            for i, doc in zip(indices, docs):
+                features[i] = self._features_from_doc(texts[i], doc, counts[i])
+
+        sentiment = self._calculate_sentiment_batch(counts[:, POSITIVE_COUNT_COL], counts[:, NEGATIVE_COUNT_COL])
+        for answer_features, answer_sentiment in zip(features, sentiment.tolist()):
+            answer_features.sentiment_score = answer_sentiment
+        return features
+
+    def _features_from_words(self, text: str, counts_row: np.ndarray | None = None) -> NLPFeatures:
+        """
+        Compute NLPFeatures for a short answer from its words alone, without running spaCy.
+
+        Coherence is taken as 1.0 and complexity uses lowercase forms instead of lemmas.
+
+        Args:
+            text: The (truncated) answer text
+            counts_row: If given, receives the vocabulary counts and sentiment is left to the caller
+
+        Returns:
+            NLPFeatures object containing all extracted features
+        """
+        text_lower = text.lower()
+        words = WORD_PATTERN.findall(text_lower)
         word_count = len(words)
-        sentences = list(doc.sents)
-        sentence_count = len(sentences)
-        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
+        sentence_count = max(1, sum(1 for part in SENTENCE_END_PATTERN.split(text) if part.strip()))
+        unique_words = set(words)
+
+        counts = self._count_vocabulary(text_lower, unique_words)
+        sentiment = self._sentiment_or_defer(counts, counts_row)
+
+        complexity = 0.0
+        if word_count > 0:
+            diversity = len(unique_words) / word_count
+            length_score = min(sum(map(len, words)) / word_count / 10, 1.0)
+            complexity = (diversity * 0.6) + (length_score * 0.4)
+
+        return NLPFeatures.model_construct(
+            word_count=word_count,
+            sentence_count=sentence_count,
+            avg_sentence_length=word_count / sentence_count,
+            sentiment_score=sentiment,
+            confidence_indicators=counts["confidence"],
+            filler_words_count=counts["filler"],
+            technical_terms_count=counts["technical"],
+            coherence_score=1.0,
+            complexity_score=complexity
+        )
 
-        # Count filler words
-        filler_count = sum(1 for word in self.filler_words if word in text_lower)
+    def _features_from_doc(self, text: str, doc, counts_row: np.ndarray | None = None) -> NLPFeatures:
+        """
+        Compute NLPFeatures from an answer and its spaCy doc.
+
+        Args:
+            text: The (truncated) answer text
+            doc: spaCy doc for the text
+            counts_row: If given, receives the vocabulary counts and sentiment is left to the caller
+
+        Returns:
+            NLPFeatures object containing all extracted features
+        """
+        text_lower = text.lower()
+
+        # Lemma/lowercase hashes, POS ids, punctuation/space flags, lengths and sentence starts
+        # for every token, exported in C: the only pass over the doc
+        attrs = doc.to_array(TOKEN_ATTRS)
+        word_mask = (attrs[:, IS_PUNCT_COL] == 0) & (attrs[:, IS_SPACE_COL] == 0)
+        word_attrs = attrs[word_mask]
 
-        # Count confidence indicators
-        confidence_count = sum(1 for word in self.confidence_indicators if word in text_lower)
+        # Sentence index of every token (the first token always opens a sentence)
+        sent_starts = attrs[:, SENT_START_COL] == 1
+        sent_starts[0] = True
+        sent_ids = np.cumsum(sent_starts) - 1
+
+        # Basic text statistics
+        word_count = word_attrs.shape[0]
+        sentence_count = int(sent_ids[-1]) + 1
+        avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
 
-        # Count technical terms
-        technical_count = sum(1 for term in self.technical_terms if term in text_lower)
+        # Count filler words, confidence indicators, technical terms and sentiment words in one scan
+        tokens = {doc.vocab.strings[int(lower_id)] for lower_id in np.unique(word_attrs[:, LOWER_COL])}
+        counts = self._count_vocabulary(text_lower, tokens)
+        filler_count = counts["filler"]
+        confidence_count = counts["confidence"]
+        technical_count = counts["technical"]
 
         # Sentiment analysis (simple approach using positive/negative word lists)
-        sentiment = self._calculate_sentiment(text_lower)
+        sentiment = self._sentiment_or_defer(counts, counts_row)
 
         # Coherence score (based on sentence connectivity)
-        coherence = self._calculate_coherence(doc, sentences)
+        coherence = self._calculate_coherence(attrs, sent_ids, sentence_count)
 
         # Complexity score (based on vocabulary diversity and word length)
-        complexity = self._calculate_complexity(words)
+        complexity = self._calculate_complexity(word_attrs)
 
-        return NLPFeatures(
+        # Every value is already a plain int/float of the right type: skip per-field validation
+        # (floats keep full precision; the schema rounds them when serialized)
+        return NLPFeatures.model_construct(
             word_count=word_count,
             sentence_count=sentence_count,
-            avg_sentence_length=round(avg_sentence_length, 2),
-            sentiment_score=round(sentiment, 3),
+            avg_sentence_length=avg_sentence_length,
+            sentiment_score=sentiment,
             confidence_indicators=confidence_count,
             filler_words_count=filler_count,
             technical_terms_count=technical_count,
-            coherence_score=round(coherence, 3),
-            complexity_score=round(complexity, 3)
+            coherence_score=coherence,
+            complexity_score=complexity
         )
 
-    def _calculate_sentiment(self, text: str) -> float:
+    def _count_vocabulary(self, text_lower: str, tokens: set[str]) -> dict[str, int]:
         """
-        Calculate basic sentiment score from -1 (negative) to 1 (positive).
-        This is a simple implementation; for production, consider using transformers.
+        Count how many distinct words of each vocabulary appear in the text.
+
+        Args:
+            text_lower: Lowercased answer text, scanned for multi-word phrases
+            tokens: Lowercased word tokens of the answer, matched against single words
+
+        Returns:
+            Dictionary mapping each vocabulary category to its number of distinct matches
         """
-        positive_words = {
-            "bien", "excelente", "gran", "positivo", "éxito", "lograr",
-            "mejorar", "efectivo", "eficiente", "fuerte", "confiado", "capaz",
-            "bueno", "genial", "increíble", "solución", "resolver"
-        }
-        negative_words = {
-            "mal", "pobre", "fallar", "difícil", "problema", "asunto", "lucha",
-            "débil", "incapaz", "no puedo", "nunca", "imposible", "confundido",
-            "error", "malo", "complicado"
-        }
+        counts = {category: len(tokens & words) for category, words in self._single_words.items()}
+
+        if self._automaton is not None:
+            # The automaton matches raw substrings: keep only hits bounded by non-word characters, like the regex's \b
+            matched = {
+                phrase
+                for end, (phrase, _) in self._automaton.iter(text_lower)
+                if not _is_word_char(text_lower, end - len(phrase)) and not _is_word_char(text_lower, end + 1)
+            }
+        else:
+            # One C-level regex scan instead of a substring check per phrase
+            matched = set(self._phrase_regex.findall(text_lower))
+
+        for phrase in matched:
+            for category in self._phrase_categories[phrase]:
+                counts[category] += 1
+        return counts
+
+    def _sentiment_or_defer(self, counts: dict[str, int], counts_row: np.ndarray | None) -> float:
+        """Score sentiment now, or store the counts in counts_row for a batch computation (returns 0.0)."""
+        if counts_row is None:
+            return self._calculate_sentiment(counts["positive"], counts["negative"])
 
-        pos_count = sum(1 for word in positive_words if word in text)
-        neg_count = sum(1 for word in negative_words if word in text)
+        counts_row[:] = [counts[category] for category in VOCABULARY_CATEGORIES]
+        return 0.0
 
+    def _calculate_sentiment_batch(self, pos_counts: np.ndarray, neg_counts: np.ndarray) -> np.ndarray:
+        """
+        Calculate sentiment scores for several answers at once.
+
+        Args:
+            pos_counts: Positive word count of each answer
+            neg_counts: Negative word count of each answer
+
+        Returns:
+            Sentiment of each answer from -1 to 1 (0 when it has no sentiment words)
+        """
+        return (pos_counts - neg_counts) / np.maximum(pos_counts + neg_counts, 1)
+
+    def _calculate_sentiment(self, pos_count: int, neg_count: int) -> float:
+        """
+        Calculate basic sentiment score from -1 (negative) to 1 (positive).
+        This is a simple implementation; for production, consider using transformers.
+        """
         total = pos_count + neg_count
         if total == 0:
             return 0.0
 
         return (pos_count - neg_count) / total
 
-    def _calculate_coherence(self, doc, sentences: list) -> float:
+    def _calculate_coherence(self, attrs: np.ndarray, sent_ids: np.ndarray, sentence_count: int) -> float:
         """
         Calculate coherence based on sentence connectivity.
         Uses overlap of entities and key terms between sentences.
+
+        Args:
+            attrs: Token attribute array of the doc (TOKEN_ATTRS columns)
+            sent_ids: Sentence index of each token
+            sentence_count: Number of sentences in the doc
         """
-        if len(sentences) <= 1:
+        if sentence_count <= 1:
             return 1.0
 
-        # Extract key nouns and entities from each sentence
-        sentence_keywords = []
-        for sent in sentences:
-            keywords = {token.lemma_.lower() for token in sent if token.pos_ in ["NOUN", "PROPN", "VERB"]}
-            sentence_keywords.append(keywords)
+        # Key nouns and verbs of each sentence, with lemma hashes mapped to small int ids
+        keyword_mask = np.isin(attrs[:, POS_COL], KEYWORD_POS)
+        keyword_sents = sent_ids[keyword_mask]
+        _, ids = np.unique(attrs[keyword_mask, LEMMA_COL], return_inverse=True)
+        ids = ids.reshape(-1).astype(np.int32)
 
-        # Calculate overlap between consecutive sentences
-        overlaps = []
-        for i in range(len(sentence_keywords) - 1):
-            current = sentence_keywords[i]
-            next_sent = sentence_keywords[i + 1]
-            if len(current) > 0 and len(next_sent) > 0:
-                overlap = len(current & next_sent) / len(current | next_sent)
-                overlaps.append(overlap)
+        if njit is None:
+            # Without numba, compare sentences as integer bitmaps: popcounts run in C, no per-id Python loop
+            return _bitmap_jaccard_chain(keyword_sents, ids, sentence_count)
 
-        return sum(overlaps) / len(overlaps) if overlaps else 0.5
+        # Sort keywords by (sentence, id) and drop repeats so each sentence holds a sorted set
+        order = np.lexsort((ids, keyword_sents))
+        keyword_sents, ids = keyword_sents[order], ids[order]
+        keep = np.ones(len(ids), dtype=bool)
+        keep[1:] = (ids[1:] != ids[:-1]) | (keyword_sents[1:] != keyword_sents[:-1])
+        keyword_sents, ids = keyword_sents[keep], ids[keep]
+
+        offsets = np.zeros(sentence_count + 1, dtype=np.int32)
+        offsets[1:] = np.cumsum(np.bincount(keyword_sents, minlength=sentence_count))
+
+        # Calculate overlap between consecutive sentences
+        return float(_jaccard_chain(offsets, ids))
 
-    def _calculate_complexity(self, words: list) -> float:
+    def _calculate_complexity(self, word_attrs: np.ndarray) -> float:
         """
         Calculate vocabulary complexity based on diversity and word length.
         Returns a score from 0 to 1.
+
+        Args:
+            word_attrs: Token attribute rows of the words (TOKEN_ATTRS columns)
         """
-        if len(words) == 0:
+        if word_attrs.shape[0] == 0:
             return 0.0
 
-        # Vocabulary diversity (unique words / total words)
-        unique_words = set(token.lemma_.lower() for token in words)
-        diversity = len(unique_words) / len(words)
-
-        # Average word length
-        avg_word_length = sum(len(token.text) for token in words) / len(words)
-        # Normalize to 0-1 (assuming avg word length of 5 is medium, 10 is complex)
-        length_score = min(avg_word_length / 10, 1.0)
+        lemma_ids = word_attrs[:, LEMMA_COL].astype(np.int64)
+        token_lengths = word_attrs[:, LENGTH_COL].astype(np.int64)
 
-        # Combine metrics
-        complexity = (diversity * 0.6) + (length_score * 0.4)
-
-        return complexity
+        return float(_complexity_kernel(lemma_ids, token_lengths))
 
     def get_feature_summary(self, features: NLPFeatures) -> Dict[str, str]:
         """
@@ -225,5 +666,8 @@ class NLPService:
         return summary
 
 
-# Singleton instance
+# Singleton instances
 nlp_service = NLPService()
+
+# spaCy's model code releases the GIL, so several threads analyze answers in parallel
+nlp_executor = ThreadPoolExecutor(max_workers=settings.nlp_threads or os.cpu_count(), thread_name_prefix="nlp")
@@ -1,7 +1,7 @@
 """
 Storage module for interview sessions.
 """
-from app.store.interview_store import interview_sessions
+from app.store.interview_store import InterviewStore, interview_sessions
 
-__all__ = ["interview_sessions"]
+__all__ = ["InterviewStore", "interview_sessions"]
 
@@ -1,8 +1,252 @@
 """
-In-memory storage for interview sessions.
+Storage for interview sessions.
+
+Sessions live in memory; when SESSION_STORE_PATH is set they are also written through to a
+SQLite database, so they survive restarts and only the most recently used ones stay in memory.
+The in-memory tier is per process and never invalidated, so several workers sharing one
+database need sticky routing (each session always served by the same worker).
+
+Async request handlers use the a-prefixed methods, which run database reads and writes in a
+worker thread instead of blocking the event loop.
 """
+import asyncio
+import math
+import pathlib
+import sqlite3
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from app.config import settings
 from app.models.schemas import InterviewState
 
-# In-memory storage for interview sessions (no database needed)
-interview_sessions: dict[str, InterviewState] = {}
 
+class InterviewStore(MutableMapping[str, InterviewState]):
+    """Dict-like session store: sharded in-memory LRUs over an optional SQLite tier."""
+
+    def __init__(self, capacity: int = 1024, path: str | None = None, shards: int = 16):
+        """
+        Initialize the store.
+
+        Args:
+            capacity: Sessions kept in memory when persisting (unbounded without a database)
+            path: SQLite database file, or None to keep sessions in memory only
+            shards: Number of independently locked partitions (a power of two)
+        """
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+
+        # Each shard has its own lock, so requests for different sessions never contend
+        self.capacity = capacity
+        self._shard_capacity = math.ceil(capacity / shards)
+        self._hot: list[OrderedDict[str, InterviewState]] = [OrderedDict() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+        # Per-session asyncio locks for request handlers, dropped once no handler holds or awaits them
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._session_locks_guard = threading.Lock()
+
+        # A sqlite3 connection must not be used by two threads at once
+        self._db = self._connect(path) if path else None
+        self._db_lock = threading.Lock()
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        """Open the session database in WAL mode so several workers can share it."""
+        db_path = pathlib.Path(path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, state BLOB NOT NULL)")
+        return db
+
+    def _shard(self, session_id: str) -> int:
+        """Map a session ID to its shard."""
+        return zlib.crc32(session_id.encode("utf-8")) & (len(self._hot) - 1)
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a statement on the session database and return the number of affected rows."""
+        with self._db_lock:
+            return self._db.execute(sql, params).rowcount
+
+    def _fetch(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a query on the session database and return all rows (fetched while holding the connection)."""
+        with self._db_lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def lock(self, session_id: str) -> asyncio.Lock:
+        """
+        Get the lock that serializes request handlers modifying a session.
+
+        Handlers await between reading a session and writing it back, so concurrent submissions
+        for the same session must hold this lock for the whole read-modify-write.
+
+        Args:
+            session_id: Session to lock
+
+        Returns:
+            The session's asyncio lock (shared within this process)
+        """
+        with self._session_locks_guard:
+            session_lock = self._session_locks.get(session_id)
+            if session_lock is None:
+                session_lock = asyncio.Lock()
+                self._session_locks[session_id] = session_lock
+            return session_lock
+
+    def _remember(self, shard: int, session_id: str, state: InterviewState) -> None:
+        """Mark a session as recently used, evicting the least recently used ones (caller holds the shard lock)."""
+        hot = self._hot[shard]
+        hot[session_id] = state
+        hot.move_to_end(session_id)
+        if self._db is not None:
+            # Every session is already in the database (write-through), so eviction only frees memory
+            while len(hot) > self._shard_capacity:
+                hot.popitem(last=False)
+
+    def __getitem__(self, session_id: str) -> InterviewState:
+        shard = self._shard(session_id)
+        with self._locks[shard]:
+            state = self._hot[shard].get(session_id)
+            if state is not None:
+                self._hot[shard].move_to_end(session_id)
+                return state
+
+            if self._db is None:
+                raise KeyError(session_id)
+            rows = self._fetch("SELECT state FROM sessions WHERE session_id = ?", (session_id,))
+            if not rows:
+                raise KeyError(session_id)
+
+            state = InterviewState.model_validate_json(rows[0][0])
+            self._remember(shard, session_id, state)
+            return state
+
+    def __setitem__(self, session_id: str, state: InterviewState) -> None:
+        shard = self._shard(session_id)
+        # Serialize before taking the shard lock so other sessions in the shard are not held up
+        blob = state.model_dump_json().encode("utf-8") if self._db is not None else None
+        with self._locks[shard]:
+            self._remember(shard, session_id, state)
+            if blob is not None:
+                self._execute("INSERT OR REPLACE INTO sessions (session_id, state) VALUES (?, ?)", (session_id, blob))
+
+    def __delitem__(self, session_id: str) -> None:
+        shard = self._shard(session_id)
+        with self._locks[shard]:
+            in_memory = self._hot[shard].pop(session_id, None) is not None
+            deleted = 0
+            if self._db is not None:
+                deleted = self._execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            if not in_memory and not deleted:
+                raise KeyError(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        if not isinstance(session_id, str):
+            return False
+        shard = self._shard(session_id)
+        with self._locks[shard]:
+            if session_id in self._hot[shard]:
+                return True
+            if self._db is None:
+                return False
+            return bool(self._fetch("SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)))
+
+    async def aget(self, session_id: str) -> InterviewState | None:
+        """
+        Get a session from an async handler, reading the database in a worker thread on a memory miss.
+
+        Args:
+            session_id: Session to get
+
+        Returns:
+            The session state, or None if it does not exist
+        """
+        shard = self._shard(session_id)
+        with self._locks[shard]:
+            state = self._hot[shard].get(session_id)
+            if state is not None:
+                self._hot[shard].move_to_end(session_id)
+                return state
+        if self._db is None:
+            return None
+        return await asyncio.to_thread(self.get, session_id)
+
+    async def aset(self, session_id: str, state: InterviewState) -> None:
+        """
+        Store a session from an async handler, serializing and writing it in a worker thread.
+
+        Args:
+            session_id: Session to store
+            state: Its state (must not be mutated until this returns)
+        """
+        if self._db is None:
+            self[session_id] = state
+        else:
+            await asyncio.to_thread(self.__setitem__, session_id, state)
+
+    async def adelete(self, session_id: str) -> None:
+        """
+        Delete a session from an async handler, writing the database in a worker thread.
+
+        Args:
+            session_id: Session to delete
+
+        Raises:
+            KeyError: If the session does not exist
+        """
+        if self._db is None:
+            del self[session_id]
+        else:
+            await asyncio.to_thread(self.__delitem__, session_id)
+
+    async def ascan(self) -> list[tuple[str, InterviewState]]:
+        """List every stored session like scan(), reading the database in a worker thread."""
+        if self._db is None:
+            return list(self.scan())
+        return await asyncio.to_thread(lambda: list(self.scan()))
+
+    def scan(self) -> Iterator[tuple[str, InterviewState]]:
+        """
+        Iterate over every stored session without marking any of them recently used.
+
+        Listing all sessions through items() would load each one into the in-memory tier and
+        flush the working set; sessions already in memory are reused, the rest are only decoded.
+
+        Yields:
+            (session_id, state) pairs
+        """
+        if self._db is None:
+            for lock, hot in zip(self._locks, self._hot):
+                with lock:
+                    sessions = list(hot.items())
+                yield from sessions
+            return
+
+        for session_id, blob in self._fetch("SELECT session_id, state FROM sessions"):
+            shard = self._shard(session_id)
+            with self._locks[shard]:
+                state = self._hot[shard].get(session_id)
+            yield session_id, state if state is not None else InterviewState.model_validate_json(blob)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._db is not None:
+            session_ids = [row[0] for row in self._fetch("SELECT session_id FROM sessions")]
+        else:
+            session_ids = []
+            for lock, hot in zip(self._locks, self._hot):
+                with lock:
+                    session_ids.extend(hot)
+        return iter(session_ids)
+
+    def __len__(self) -> int:
+        if self._db is not None:
+            return self._fetch("SELECT COUNT(*) FROM sessions")[0][0]
+        return sum(len(hot) for hot in self._hot)
+
+
+# Interview sessions by session ID (in memory unless SESSION_STORE_PATH is set)
+interview_sessions = InterviewStore(capacity=settings.session_cache_size, path=settings.session_store_path)
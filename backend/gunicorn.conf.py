@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for multi-worker deployments (run from backend/: gunicorn app.main:app).
+
+The app is preloaded in the master process and the spaCy model is warmed up there, so forked
+workers share the model pages copy-on-write instead of each loading their own copy.
+"""
+import gc
+from app.config import settings
+
+bind = "0.0.0.0:8000"
+workers = settings.workers
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+
+def on_starting(server):
+    """Load and warm up spaCy in the master, after the app is preloaded and before workers fork."""
+    from app.services.nlp_service import nlp_service
+
+    nlp_service.preload()
+    # Keep the garbage collector from touching (and so copying) the preloaded objects in each worker
+    gc.freeze()
@@ -0,0 +1,22 @@
+"""
+Pin the closed-form fuzzy inference to the scikit-fuzzy control systems it replaced.
+"""
+import pytest
+from app.services.fuzzy_service import _evaluate_fuzzy
+
+
+# (coherence, filler_ratio, confidence_level, word_count, technical_depth, complexity)
+# -> (clarity, confidence, relevance) as computed by skfuzzy.control with the original rules
+SKFUZZY_REFERENCE = [
+    ((8, 1, 8, 8, 8, 8), (9.2222, 9.2222, 9.2222)),
+    ((5, 5, 5, 5, 5, 5), (4.0, 7.0, 7.0)),
+    ((2, 9, 2, 2, 2, 2), (1.0833, 1.1667, 1.1667)),
+    ((7, 3, 6, 4, 7, 5), (7.0, 7.0, 7.0)),
+    ((4, 6, 7, 8, 3, 9), (4.0, 9.119, 1.3214)),
+]
+
+
+@pytest.mark.parametrize("inputs,expected", SKFUZZY_REFERENCE)
+def test_evaluate_fuzzy_matches_skfuzzy(inputs, expected):
+    clarity, confidence, relevance = _evaluate_fuzzy(*inputs)
+    assert (float(clarity), float(confidence), float(relevance)) == pytest.approx(expected, abs=0.05)
@@ -0,0 +1,99 @@
+"""
+Round-trip and eviction behaviour of the SQLite-backed session store.
+"""
+import asyncio
+import pytest
+from app.models.schemas import InterviewState
+from app.store.interview_store import InterviewStore
+
+
+def make_state(index: int) -> InterviewState:
+    return InterviewState(
+        session_id=f"session-{index}",
+        role="Backend Developer",
+        seniority="Senior",
+        answers=[f"Respuesta {index}"]
+    )
+
+
+def test_sessions_survive_reopening_the_database(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    state = make_state(1)
+
+    InterviewStore(path=path)[state.session_id] = state
+    reopened = InterviewStore(path=path)
+
+    assert state.session_id in reopened
+    assert reopened[state.session_id].model_dump() == state.model_dump()
+    assert list(reopened) == [state.session_id]
+
+
+def test_eviction_keeps_memory_bounded_without_losing_sessions(tmp_path):
+    store = InterviewStore(capacity=16, path=str(tmp_path / "sessions.db"), shards=16)
+    states = [make_state(i) for i in range(200)]
+    for state in states:
+        store[state.session_id] = state
+
+    assert sum(len(hot) for hot in store._hot) <= store.capacity
+    assert len(store) == len(states)
+    for state in states:
+        assert store[state.session_id].answers == state.answers
+
+
+def test_delete_removes_session_from_memory_and_database(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = InterviewStore(path=path)
+    state = make_state(1)
+    store[state.session_id] = state
+
+    del store[state.session_id]
+
+    assert state.session_id not in store
+    assert state.session_id not in InterviewStore(path=path)
+    with pytest.raises(KeyError):
+        del store[state.session_id]
+
+
+def test_memory_only_store_is_unbounded():
+    store = InterviewStore(capacity=1, shards=1)
+    for i in range(10):
+        store[f"session-{i}"] = make_state(i)
+
+    assert len(store) == 10
+    with pytest.raises(KeyError):
+        store["missing"]
+
+
+def test_scan_lists_sessions_without_promoting_them(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    writer = InterviewStore(path=path)
+    states = [make_state(i) for i in range(5)]
+    for state in states:
+        writer[state.session_id] = state
+
+    store = InterviewStore(path=path)
+    scanned = dict(store.scan())
+
+    assert sorted(scanned) == sorted(state.session_id for state in states)
+    assert scanned["session-3"].answers == ["Respuesta 3"]
+    assert sum(len(hot) for hot in store._hot) == 0
+
+
+def test_async_methods_go_through_the_database(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    state = make_state(1)
+
+    async def scenario():
+        store = InterviewStore(path=path)
+        await store.aset(state.session_id, state)
+        reopened = InterviewStore(path=path)
+        loaded = await reopened.aget(state.session_id)
+        listed = await reopened.ascan()
+        await reopened.adelete(state.session_id)
+        return loaded, listed, await reopened.aget(state.session_id)
+
+    loaded, listed, deleted = asyncio.run(scenario())
+
+    assert loaded.model_dump() == state.model_dump()
+    assert [session_id for session_id, _ in listed] == [state.session_id]
+    assert deleted is None
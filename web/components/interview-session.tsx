@@ -80,7 +80,7 @@ export function InterviewSession({ interviewData, onComplete }: InterviewSession
   })
 
   // Play audio from base64 data
-  const playAudioFromBase64 = (base64Data: string): Promise<void> => {
+  const playAudioFromBase64 = (base64Data: string, mimeType: string = 'audio/mpeg'): Promise<void> => {
     // Stop any existing audio first
     if (currentAudioRef.current) {
       currentAudioRef.current.pause()
@@ -97,7 +97,7 @@ export function InterviewSession({ interviewData, onComplete }: InterviewSession
         for (let i = 0; i < binaryString.length; i++) {
           bytes[i] = binaryString.charCodeAt(i)
         }
-        const blob = new Blob([bytes], { type: 'audio/mpeg' })
+        const blob = new Blob([bytes], { type: mimeType })
         
         // Create audio element and play
         const audio = new Audio(URL.createObjectURL(blob))
@@ -148,7 +148,7 @@ export function InterviewSession({ interviewData, onComplete }: InterviewSession
     try {
       setIsPlayingAudio(true)
       setError(null)
-      await playAudioFromBase64(question.audio_data)
+      await playAudioFromBase64(question.audio_data, question.audio_mime_type ?? undefined)
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : 'Unknown error'
       
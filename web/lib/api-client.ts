@@ -203,6 +203,9 @@ class APIClient {
                 onComplete(data.question_text)
               } else if (data.type === 'evaluation_complete') {
                 onMetadata(data)
+              } else if (data.type === 'error') {
+                onError(new Error(data.detail))
+                return
               }
             } catch (e) {
               console.error('Error parsing SSE data:', e)
@@ -23,6 +23,7 @@ export interface Question {
   category: string | null
   timestamp: string
   audio_data?: string | null  // Base64-encoded audio data
+  audio_mime_type?: string | null  // MIME type of audio_data (audio/mpeg or audio/ogg; codecs=opus)
 }
 
 export interface EvaluationScore {